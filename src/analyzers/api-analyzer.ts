@@ -1,4 +1,3 @@
-import * as fs from 'fs';
 import { 
   FileInfo, ParseResult, ApiAnalysis, FunctionInfo, ClassInfo, EndpointInfo, ApiSchemaInfo, 
   AuthenticationInfo, ErrorHandlerInfo, ServerFrameworkInfo, ApiArchitectureInfo, 
@@ -8,14 +7,90 @@ import {
   ContentNegotiationInfo, PaginationInfo, OutputSanitizationInfo,
   AuthorizationInfo, InputValidationInfo, VulnerabilityInfo
 } from '../types';
+import { FileContentCache } from '../utils';
 
 export class ApiAnalyzer {
   private repoPath: string;
   private parserResults: Record<string, ParseResult>;
+  // Every analysis pass reads the same files, so contents are read from disk once
+  private fileContents: FileContentCache;
 
-  constructor(repoPath: string, _fileData: FileInfo[], parserResults: Record<string, ParseResult>) {
+  // Non-global patterns below are compiled once per analyzer instead of on every call
+
+  // Framework detection signatures, one alternation per framework so content is scanned once
+  private expressPattern = /import.*express.*from.*['"`]express['"`]|require\(['"`]express['"`]\)|express\(\)|app\.use\(|app\.(get|post|put|delete|patch)\(/;
+
+  private nestPattern = /@nestjs\/common|@nestjs\/core|@Controller\(|@Injectable\(|@Module\(|NestFactory\.create/;
+
+  private fastifyPattern = /import.*fastify.*from.*['"`]fastify['"`]|require\(['"`]fastify['"`]\)|fastify\(\)|\.register\(|\.addHook\(/;
+
+  private koaPattern = /import.*Koa.*from.*['"`]koa['"`]|require\(['"`]koa['"`]\)|new Koa\(\)|\.use\(.*ctx.*next|ctx\.(request|response|body)/;
+
+  private graphqlPattern = /apollo-server|ApolloServer|buildSchema|GraphQLSchema|type Query|type Mutation/;
+
+  // Kept separate because it is the only case-insensitive GraphQL signature
+  private graphqlResolverPattern = /@resolver/i;
+
+  private socketPattern = /socket\.io|io\.(on|emit)|socket\.(on|emit|broadcast)|Server.*socket\.io|socketio/;
+
+  // More specific JWT patterns - look for actual usage, not just mentions
+  private jwtPattern = /jwt\.sign\s*\(|jwt\.verify\s*\(|jwt\.decode\s*\(|Bearer\s+[\w.-]+|Authorization.*Bearer|jsonwebtoken/i;
+
+  // Case-sensitive on purpose: a generic .sign(payload, 'secret') call
+  private jwtSignCallPattern = /\.sign\s*\(\s*\{.*\}\s*,\s*['"`][\w.-]+['"`]/;
+
+  // More specific OAuth patterns - look for actual OAuth flow implementation
+  private oauthPattern = /client_id.*client_secret|oauth2?\.authorize|access_token.*refresh_token|grant_type.*authorization_code|scope.*openid/i;
+
+  // More specific API Key patterns - look for header setting or validation
+  private apiKeyPattern = /x-api-key.*headers|api[_-]?key.*headers|headers\[['"`]x-api-key['"`]\]|req\.headers\[['"`]api[_-]?key['"`]\]|\.setHeader\s*\(\s*['"`]x-api-key['"`]/i;
+
+  // More specific Session patterns - look for actual session usage
+  private sessionPattern = /express-session|session\.save\s*\(|session\.destroy\s*\(|req\.session\.|connect\.session|cookie-session/i;
+
+  private authFunctionPattern = /^(?:(authenticate|authorize|login|logout|signin|signout|signup|register)|(verify|validate|check).*?(token|auth|permission|access)|(create|generate|issue).*?(token|jwt)|(refresh|revoke|invalidate).*?(token|session)|.*?(middleware|guard|auth))$/i;
+
+  private authConstantPattern = /^(?:(jwt|auth).*?(secret|key|token)|(client|api).*?(id|key|secret)|(access|refresh).*?token|.*?(secret|key)|(oauth|bearer|session).*?(config|settings))$/i;
+
+  private nestDecoratorPatterns = [
+    { pattern: /@Controller\(([^)]*)\)/, type: 'controller' as const },
+    { pattern: /@Injectable\(\)/, type: 'service' as const },
+    { pattern: /@Guard\(([^)]*)\)/, type: 'guard' as const },
+    { pattern: /@Interceptor\(([^)]*)\)/, type: 'interceptor' as const },
+    { pattern: /@Pipe\(([^)]*)\)/, type: 'pipe' as const }
+  ];
+
+  // Master patterns let lines without any Nest decorator skip the per-decorator tables below
+  private nestDecoratorPattern = /@(?:Controller|Injectable|Guard|Interceptor|Pipe)\(/;
+
+  private nestRouteDecoratorPattern = /@(?:Get|Post|Put|Delete|Patch)\(/;
+
+  private nestRouteDecorators = [
+    { pattern: /@Get\(['"`]?([^'"`)]*)['"`]?\)/, method: 'GET' },
+    { pattern: /@Post\(['"`]?([^'"`)]*)['"`]?\)/, method: 'POST' },
+    { pattern: /@Put\(['"`]?([^'"`)]*)['"`]?\)/, method: 'PUT' },
+    { pattern: /@Delete\(['"`]?([^'"`)]*)['"`]?\)/, method: 'DELETE' },
+    { pattern: /@Patch\(['"`]?([^'"`)]*)['"`]?\)/, method: 'PATCH' }
+  ];
+
+  private restfulPathPatterns: RegExp[] = [
+    /^\/[a-z]+s(\/\{[^}]+\})?(\/[a-z]+s?)?(\/\{[^}]+\})?$/i, // /users/{id}/posts/{postId}
+    /^\/api\/v\d+\/[a-z]+s/i // /api/v1/users
+  ];
+
+  private apiVersionPattern = /\/v(\d+(?:\.\d+)?)\//;
+
+  // Keyword alternations matched against lowercased names
+  private apiFileIndicatorPattern = /api|routes|endpoints|controllers|handlers|public|index|main/;
+
+  private apiSchemaIndicatorPattern = /request|response|dto|payload|schema|model|entity|api|input|output|body|params|query|headers/;
+
+  private errorIndicatorPattern = /error|exception|catch|handler|fail/;
+
+  constructor(repoPath: string, fileData: FileInfo[], parserResults: Record<string, ParseResult>) {
     this.repoPath = repoPath;
     this.parserResults = parserResults;
+    this.fileContents = new FileContentCache(repoPath, fileData);
   }
 
   public analyze(): ApiAnalysis {
@@ -46,20 +121,33 @@ export class ApiAnalyzer {
     };
   }
 
+  // Read all parsed files concurrently so analyze() finds them in the content cache
+  public async preloadFileContents(): Promise<void> {
+    await this.fileContents.preload(Object.keys(this.parserResults));
+  }
+
   private extractPublicFunctions(): FunctionInfo[] {
     const publicFunctions: FunctionInfo[] = [];
 
     for (const [filePath, parseResult] of Object.entries(this.parserResults)) {
       // Add exported functions
-      const exportedFunctionNames = parseResult.exports
-        .filter(exp => exp.type === 'function')
-        .map(exp => exp.name);
+      const exportedFunctionNames = new Set(
+        parseResult.exports
+          .filter(exp => exp.type === 'function')
+          .map(exp => exp.name)
+      );
 
-      for (const func of parseResult.functions) {
-        if (this.isPublicFunction(func, exportedFunctionNames, filePath)) {
-          const fileContent = this.getFileContent(filePath);
+      const apiFile = this.isApiFile(filePath);
+      const fileContent = this.getFileContent(filePath);
+      // Built on first use so files without public functions never pay for it
+      let functionIndex: { bodies: string[]; callPatterns: RegExp[] } | null = null;
+
+      for (let i = 0; i < parseResult.functions.length; i++) {
+        const func = parseResult.functions[i];
+        if (this.isPublicFunction(func, exportedFunctionNames, filePath, apiFile)) {
           const codeSnippet = fileContent ? this.extractFunctionCode(func, fileContent) : undefined;
-          const relationships = this.extractFunctionRelationships(func, fileContent || '', parseResult);
+          functionIndex = functionIndex || this.buildFunctionIndex(fileContent || '', parseResult);
+          const relationships = this.extractFunctionRelationships(i, functionIndex, parseResult);
           
           publicFunctions.push({
             ...func,
@@ -81,12 +169,15 @@ export class ApiAnalyzer {
 
     for (const [filePath, parseResult] of Object.entries(this.parserResults)) {
       // Add exported classes
-      const exportedClassNames = parseResult.exports
-        .filter(exp => exp.type === 'class')
-        .map(exp => exp.name);
+      const exportedClassNames = new Set(
+        parseResult.exports
+          .filter(exp => exp.type === 'class')
+          .map(exp => exp.name)
+      );
+      const apiFile = this.isApiFile(filePath);
 
       for (const cls of parseResult.classes) {
-        if (this.isPublicClass(cls, exportedClassNames, filePath)) {
+        if (this.isPublicClass(cls, exportedClassNames, filePath, apiFile)) {
           publicClasses.push({
             ...cls,
             // Add file context
@@ -116,9 +207,9 @@ export class ApiAnalyzer {
     return endpoints.sort((a, b) => a.path.localeCompare(b.path));
   }
 
-  private isPublicFunction(func: FunctionInfo, exportedNames: string[], filePath: string): boolean {
+  private isPublicFunction(func: FunctionInfo, exportedNames: Set<string>, filePath: string, apiFile: boolean): boolean {
     // Check if explicitly exported
-    if (exportedNames.includes(func.name)) {
+    if (exportedNames.has(func.name)) {
       return true;
     }
 
@@ -128,16 +219,16 @@ export class ApiAnalyzer {
     }
 
     // In JS/TS, check if it's in a file that's likely to be a public API
-    if (this.isApiFile(filePath)) {
+    if (apiFile) {
       return true;
     }
 
     return false;
   }
 
-  private isPublicClass(cls: ClassInfo, exportedNames: string[], filePath: string): boolean {
+  private isPublicClass(cls: ClassInfo, exportedNames: Set<string>, filePath: string, apiFile: boolean): boolean {
     // Check if explicitly exported
-    if (exportedNames.includes(cls.name)) {
+    if (exportedNames.has(cls.name)) {
       return true;
     }
 
@@ -147,7 +238,7 @@ export class ApiAnalyzer {
     }
 
     // In JS/TS, check if it's in a file that's likely to be a public API
-    if (this.isApiFile(filePath)) {
+    if (apiFile) {
       return true;
     }
 
@@ -155,28 +246,12 @@ export class ApiAnalyzer {
   }
 
   private isApiFile(filePath: string): boolean {
-    const apiIndicators = [
-      'api',
-      'routes',
-      'endpoints',
-      'controllers',
-      'handlers',
-      'public',
-      'index',
-      'main'
-    ];
-
     const fileName = filePath.toLowerCase();
-    return apiIndicators.some(indicator => fileName.includes(indicator));
+    return this.apiFileIndicatorPattern.test(fileName);
   }
 
   private getFileContent(filePath: string): string | null {
-    try {
-      const fullPath = require('path').join(this.repoPath, filePath);
-      return fs.readFileSync(fullPath, 'utf-8');
-    } catch {
-      return null;
-    }
+    return this.fileContents.get(filePath);
   }
 
   private extractExpressEndpoints(filePath: string, content: string, parseResult: ParseResult): EndpointInfo[] {
@@ -221,6 +296,7 @@ export class ApiAnalyzer {
 
     for (let i = 0; i < lines.length; i++) {
       const line = lines[i];
+      if (!line.includes('@app.')) continue;
       let match;
 
       while ((match = fastApiPattern.exec(line)) !== null) {
@@ -254,6 +330,7 @@ export class ApiAnalyzer {
 
     for (let i = 0; i < lines.length; i++) {
       const line = lines[i];
+      if (!line.includes('@app.route')) continue;
       let match;
 
       while ((match = flaskPattern.exec(line)) !== null) {
@@ -291,11 +368,14 @@ export class ApiAnalyzer {
     for (const pattern of restPatterns) {
       let match;
       while ((match = pattern.exec(content)) !== null) {
+        // Same property set as the framework extractors so every EndpointInfo shares one object shape
         endpoints.push({
           method: match[1],
           path: match[2],
           file: filePath,
-          function: 'documented'
+          function: 'documented',
+          requestSchema: undefined,
+          responseSchema: undefined
         });
       }
     }
@@ -404,10 +484,18 @@ export class ApiAnalyzer {
       const fileContent = this.getFileContent(filePath);
       if (!fileContent) continue;
 
+      // Validation-library markers are a property of the file, not of each interface
+      let schemaMarkers: boolean | undefined;
+      const isApiSchema = (name: string): boolean => {
+        if (this.isApiSchemaName(name)) return true;
+        if (schemaMarkers === undefined) schemaMarkers = this.hasSchemaMarkers(fileContent);
+        return schemaMarkers;
+      };
+
       // Extract TypeScript interfaces that look like API schemas
       if (parseResult.interfaces) {
         for (const iface of parseResult.interfaces) {
-          if (this.isApiSchema(iface.name, fileContent)) {
+          if (isApiSchema(iface.name)) {
             schemas.push({
               name: iface.name,
               type: 'interface',
@@ -423,7 +511,7 @@ export class ApiAnalyzer {
       // Extract type aliases that look like API types
       if (parseResult.typeAliases) {
         for (const typeAlias of parseResult.typeAliases) {
-          if (this.isApiSchema(typeAlias.name, fileContent)) {
+          if (isApiSchema(typeAlias.name)) {
             schemas.push({
               name: typeAlias.name,
               type: 'typeAlias',
@@ -502,9 +590,15 @@ export class ApiAnalyzer {
       const fileContent = this.getFileContent(filePath);
       if (!fileContent) continue;
 
+      // File-level markers are the same for every function, so check them once
+      const mentionsError = fileContent.includes('error');
+      const hasMiddleware = fileContent.includes('middleware') ||
+                            fileContent.includes('next()') ||
+                            fileContent.includes('req, res, next');
+
       // Look for error handling patterns
       for (const func of parseResult.functions) {
-        if (this.isErrorHandler(func.name, fileContent)) {
+        if (this.isErrorHandler(func.name, fileContent, mentionsError)) {
           const errorTypes = this.extractErrorTypes(func, fileContent);
           errorHandlers.push({
             name: func.name,
@@ -512,7 +606,7 @@ export class ApiAnalyzer {
             lineStart: func.lineStart,
             lineEnd: func.lineEnd,
             errorTypes,
-            isMiddleware: this.isMiddleware(func.name, fileContent),
+            isMiddleware: this.isMiddleware(func.name, hasMiddleware),
             description: func.docstring || `Error handler: ${func.name}`
           });
         }
@@ -526,15 +620,13 @@ export class ApiAnalyzer {
     return errorHandlers;
   }
 
-  private isApiSchema(name: string, content: string): boolean {
-    const apiIndicators = [
-      'request', 'response', 'dto', 'payload', 'schema', 'model', 'entity',
-      'api', 'input', 'output', 'body', 'params', 'query', 'headers'
-    ];
-    
+  private isApiSchemaName(name: string): boolean {
     const lowerName = name.toLowerCase();
-    return apiIndicators.some(indicator => lowerName.includes(indicator)) ||
-           content.includes(`@ApiProperty`) || // NestJS
+    return this.apiSchemaIndicatorPattern.test(lowerName);
+  }
+
+  private hasSchemaMarkers(content: string): boolean {
+    return content.includes(`@ApiProperty`) || // NestJS
            content.includes(`@JsonProperty`) || // Java
            content.includes(`Field(`) || // Python Pydantic
            content.includes(`z.object`) || // Zod schema
@@ -562,18 +654,7 @@ export class ApiAnalyzer {
         continue;
       }
       
-      // More specific JWT patterns - look for actual usage, not just mentions
-      const jwtPatterns = [
-        /jwt\.sign\s*\(/i,
-        /jwt\.verify\s*\(/i,
-        /jwt\.decode\s*\(/i,
-        /Bearer\s+[\w.-]+/i,
-        /Authorization.*Bearer/i,
-        /jsonwebtoken/i,
-        /\.sign\s*\(\s*\{.*\}\s*,\s*['"`][\w.-]+['"`]/
-      ];
-      
-      if (jwtPatterns.some(pattern => pattern.test(line))) {
+      if (this.jwtPattern.test(line) || this.jwtSignCallPattern.test(line)) {
         patterns.push({
           type: 'jwt',
           name: 'JWT Authentication',
@@ -584,16 +665,7 @@ export class ApiAnalyzer {
         });
       }
 
-      // More specific OAuth patterns - look for actual OAuth flow implementation
-      const oauthPatterns = [
-        /client_id.*client_secret/i,
-        /oauth2?\.authorize/i,
-        /access_token.*refresh_token/i,
-        /grant_type.*authorization_code/i,
-        /scope.*openid/i
-      ];
-      
-      if (oauthPatterns.some(pattern => pattern.test(line))) {
+      if (this.oauthPattern.test(line)) {
         patterns.push({
           type: 'oauth',
           name: 'OAuth Authentication',
@@ -604,16 +676,7 @@ export class ApiAnalyzer {
         });
       }
 
-      // More specific API Key patterns - look for header setting or validation
-      const apiKeyPatterns = [
-        /x-api-key.*headers/i,
-        /api[_-]?key.*headers/i,
-        /headers\[['"`]x-api-key['"`]\]/i,
-        /req\.headers\[['"`]api[_-]?key['"`]\]/i,
-        /\.setHeader\s*\(\s*['"`]x-api-key['"`]/i
-      ];
-      
-      if (apiKeyPatterns.some(pattern => pattern.test(line))) {
+      if (this.apiKeyPattern.test(line)) {
         patterns.push({
           type: 'apiKey',
           name: 'API Key Authentication',
@@ -624,17 +687,7 @@ export class ApiAnalyzer {
         });
       }
 
-      // More specific Session patterns - look for actual session usage
-      const sessionPatterns = [
-        /express-session/i,
-        /session\.save\s*\(/i,
-        /session\.destroy\s*\(/i,
-        /req\.session\./i,
-        /connect\.session/i,
-        /cookie-session/i
-      ];
-      
-      if (sessionPatterns.some(pattern => pattern.test(line))) {
+      if (this.sessionPattern.test(line)) {
         patterns.push({
           type: 'session',
           name: 'Session Authentication',
@@ -650,27 +703,11 @@ export class ApiAnalyzer {
   }
 
   private isAuthFunction(name: string): boolean {
-    const authFunctionPatterns = [
-      /^(authenticate|authorize|login|logout|signin|signout|signup|register)$/i,
-      /^(verify|validate|check).*?(token|auth|permission|access)$/i,
-      /^(create|generate|issue).*?(token|jwt)$/i,
-      /^(refresh|revoke|invalidate).*?(token|session)$/i,
-      /^.*?(middleware|guard|auth)$/i
-    ];
-    
-    return authFunctionPatterns.some(pattern => pattern.test(name));
+    return this.authFunctionPattern.test(name);
   }
 
   private isAuthConstant(name: string): boolean {
-    const authConstantPatterns = [
-      /^(jwt|auth).*?(secret|key|token)$/i,
-      /^(client|api).*?(id|key|secret)$/i,
-      /^(access|refresh).*?token$/i,
-      /^.*?(secret|key)$/i,
-      /^(oauth|bearer|session).*?(config|settings)$/i
-    ];
-    
-    return authConstantPatterns.some(pattern => pattern.test(name));
+    return this.authConstantPattern.test(name);
   }
 
   private extractAuthPattern(funcName: string): string {
@@ -694,20 +731,15 @@ export class ApiAnalyzer {
     return 'Configuration';
   }
 
-  private isErrorHandler(funcName: string, content: string): boolean {
-    const errorIndicators = ['error', 'exception', 'catch', 'handler', 'fail'];
+  private isErrorHandler(funcName: string, content: string, mentionsError: boolean): boolean {
     const lowerName = funcName.toLowerCase();
     
-    return errorIndicators.some(indicator => lowerName.includes(indicator)) ||
-           content.includes(`function ${funcName}`) && content.includes('error') ||
-           content.includes(`const ${funcName}`) && content.includes('error');
+    return this.errorIndicatorPattern.test(lowerName) ||
+           mentionsError && (content.includes(`function ${funcName}`) || content.includes(`const ${funcName}`));
   }
 
-  private isMiddleware(funcName: string, content: string): boolean {
-    return content.includes('middleware') ||
-           content.includes('next()') ||
-           content.includes('req, res, next') ||
-           funcName.toLowerCase().includes('middleware');
+  private isMiddleware(funcName: string, hasMiddleware: boolean): boolean {
+    return hasMiddleware || funcName.toLowerCase().includes('middleware');
   }
 
   private extractErrorTypes(func: FunctionInfo, content: string): string[] {
@@ -736,6 +768,11 @@ export class ApiAnalyzer {
 
   private extractTryCatchBlocks(content: string, filePath: string): ErrorHandlerInfo[] {
     const blocks: ErrorHandlerInfo[] = [];
+
+    // Most files have no try blocks; skip splitting them into lines
+    if (!content.includes('try')) {
+      return blocks;
+    }
     const lines = content.split('\n');
     
     for (let i = 0; i < lines.length; i++) {
@@ -770,8 +807,10 @@ export class ApiAnalyzer {
       
       if (line.includes('try')) inTryBlock = true;
       if (inTryBlock) {
-        braceCount += (line.match(/\{/g) || []).length;
-        braceCount -= (line.match(/\}/g) || []).length;
+        for (const char of line) {
+          if (char === '{') braceCount++;
+          else if (char === '}') braceCount--;
+        }
         
         if (line.includes('catch') && braceCount <= 1) {
           return i;
@@ -901,24 +940,39 @@ export class ApiAnalyzer {
     return cleanedLines.join('\n').trim();
   }
 
-  private extractFunctionRelationships(func: FunctionInfo, content: string, parseResult: ParseResult): {calls: string[], calledBy: string[]} {
-    const functionContent = this.extractFunctionContent(func, content);
+  private buildFunctionIndex(content: string, parseResult: ParseResult): { bodies: string[]; callPatterns: RegExp[] } {
+    const lines = content.split('\n');
+    const bodies: string[] = [];
+    const callPatterns: RegExp[] = [];
+
+    for (const func of parseResult.functions) {
+      const startIndex = Math.max(0, func.lineStart - 1);
+      const endIndex = Math.min(lines.length, func.lineEnd);
+      bodies.push(lines.slice(startIndex, endIndex).join('\n'));
+      // Non-global so test() carries no lastIndex state between calls
+      callPatterns.push(new RegExp(`\\b${func.name}\\s*\\(`));
+    }
+
+    return { bodies, callPatterns };
+  }
+
+  private extractFunctionRelationships(funcIndex: number, index: { bodies: string[]; callPatterns: RegExp[] }, parseResult: ParseResult): {calls: string[], calledBy: string[]} {
+    const func = parseResult.functions[funcIndex];
+    const functionContent = index.bodies[funcIndex];
+    const calledByPattern = index.callPatterns[funcIndex];
     const calls: string[] = [];
     const calledBy: string[] = [];
     
-    // Find functions this function calls
-    for (const otherFunc of parseResult.functions) {
+    for (let j = 0; j < parseResult.functions.length; j++) {
+      const otherFunc = parseResult.functions[j];
       if (otherFunc.name !== func.name) {
         // Check if this function calls the other function
-        const callPattern = new RegExp(`\\b${otherFunc.name}\\s*\\(`, 'g');
-        if (callPattern.test(functionContent)) {
+        if (index.callPatterns[j].test(functionContent)) {
           calls.push(otherFunc.name);
         }
         
         // Check if the other function calls this function
-        const otherFuncContent = this.extractFunctionContent(otherFunc, content);
-        const calledByPattern = new RegExp(`\\b${func.name}\\s*\\(`, 'g');
-        if (calledByPattern.test(otherFuncContent)) {
+        if (calledByPattern.test(index.bodies[j])) {
           calledBy.push(otherFunc.name);
         }
       }
@@ -978,15 +1032,7 @@ export class ApiAnalyzer {
   }
 
   private detectExpressFramework(filePath: string, content: string, parseResult: ParseResult): Partial<ServerFrameworkInfo> | null {
-    const expressPatterns = [
-      /import.*express.*from.*['"`]express['"`]/,
-      /require\(['"`]express['"`]\)/,
-      /express\(\)/,
-      /app\.use\(/,
-      /app\.(get|post|put|delete|patch)\(/
-    ];
-
-    if (!expressPatterns.some(pattern => pattern.test(content))) {
+    if (!this.expressPattern.test(content)) {
       return null;
     }
 
@@ -1004,16 +1050,7 @@ export class ApiAnalyzer {
   }
 
   private detectNestJSFramework(filePath: string, content: string, parseResult: ParseResult): Partial<ServerFrameworkInfo> | null {
-    const nestPatterns = [
-      /@nestjs\/common/,
-      /@nestjs\/core/,
-      /@Controller\(/,
-      /@Injectable\(/,
-      /@Module\(/,
-      /NestFactory\.create/
-    ];
-
-    if (!nestPatterns.some(pattern => pattern.test(content))) {
+    if (!this.nestPattern.test(content)) {
       return null;
     }
 
@@ -1033,15 +1070,7 @@ export class ApiAnalyzer {
   }
 
   private detectFastifyFramework(filePath: string, content: string, parseResult: ParseResult): Partial<ServerFrameworkInfo> | null {
-    const fastifyPatterns = [
-      /import.*fastify.*from.*['"`]fastify['"`]/,
-      /require\(['"`]fastify['"`]\)/,
-      /fastify\(\)/,
-      /\.register\(/,
-      /\.addHook\(/
-    ];
-
-    if (!fastifyPatterns.some(pattern => pattern.test(content))) {
+    if (!this.fastifyPattern.test(content)) {
       return null;
     }
 
@@ -1061,15 +1090,7 @@ export class ApiAnalyzer {
   }
 
   private detectKoaFramework(filePath: string, content: string, parseResult: ParseResult): Partial<ServerFrameworkInfo> | null {
-    const koaPatterns = [
-      /import.*Koa.*from.*['"`]koa['"`]/,
-      /require\(['"`]koa['"`]\)/,
-      /new Koa\(\)/,
-      /\.use\(.*ctx.*next/,
-      /ctx\.(request|response|body)/
-    ];
-
-    if (!koaPatterns.some(pattern => pattern.test(content))) {
+    if (!this.koaPattern.test(content)) {
       return null;
     }
 
@@ -1087,17 +1108,7 @@ export class ApiAnalyzer {
   }
 
   private detectGraphQLFramework(filePath: string, content: string, parseResult: ParseResult): Partial<ServerFrameworkInfo> | null {
-    const graphqlPatterns = [
-      /apollo-server/,
-      /ApolloServer/,
-      /buildSchema/,
-      /GraphQLSchema/,
-      /type Query/,
-      /type Mutation/,
-      /@resolver/i
-    ];
-
-    if (!graphqlPatterns.some(pattern => pattern.test(content))) {
+    if (!this.graphqlPattern.test(content) && !this.graphqlResolverPattern.test(content)) {
       return null;
     }
 
@@ -1113,15 +1124,7 @@ export class ApiAnalyzer {
   }
 
   private detectSocketIOFramework(filePath: string, content: string, parseResult: ParseResult): Partial<ServerFrameworkInfo> | null {
-    const socketPatterns = [
-      /socket\.io/,
-      /io\.(on|emit)/,
-      /socket\.(on|emit|broadcast)/,
-      /Server.*socket\.io/,
-      /socketio/
-    ];
-
-    if (!socketPatterns.some(pattern => pattern.test(content))) {
+    if (!this.socketPattern.test(content)) {
       return null;
     }
 
@@ -1222,19 +1225,12 @@ export class ApiAnalyzer {
 
   private extractNestDecorators(content: string, filePath: string): DecoratorInfo[] {
     const decorators: DecoratorInfo[] = [];
-    const decoratorPatterns = [
-      { pattern: /@Controller\(([^)]*)\)/, type: 'controller' as const },
-      { pattern: /@Injectable\(\)/, type: 'service' as const },
-      { pattern: /@Guard\(([^)]*)\)/, type: 'guard' as const },
-      { pattern: /@Interceptor\(([^)]*)\)/, type: 'interceptor' as const },
-      { pattern: /@Pipe\(([^)]*)\)/, type: 'pipe' as const }
-    ];
-
     const lines = content.split('\n');
     for (let i = 0; i < lines.length; i++) {
       const line = lines[i];
+      if (!this.nestDecoratorPattern.test(line)) continue;
       
-      for (const { pattern, type } of decoratorPatterns) {
+      for (const { pattern, type } of this.nestDecoratorPatterns) {
         const match = line.match(pattern);
         if (match) {
           // Find the class or method this decorator applies to
@@ -1272,15 +1268,9 @@ export class ApiAnalyzer {
 
     for (let i = 0; i < lines.length; i++) {
       const line = lines[i];
-      const routeDecorators = [
-        { pattern: /@Get\(['"`]?([^'"`)]*)['"`]?\)/, method: 'GET' },
-        { pattern: /@Post\(['"`]?([^'"`)]*)['"`]?\)/, method: 'POST' },
-        { pattern: /@Put\(['"`]?([^'"`)]*)['"`]?\)/, method: 'PUT' },
-        { pattern: /@Delete\(['"`]?([^'"`)]*)['"`]?\)/, method: 'DELETE' },
-        { pattern: /@Patch\(['"`]?([^'"`)]*)['"`]?\)/, method: 'PATCH' }
-      ];
-
-      for (const { pattern, method } of routeDecorators) {
+      if (!this.nestRouteDecoratorPattern.test(line)) continue;
+
+      for (const { pattern, method } of this.nestRouteDecorators) {
         const match = line.match(pattern);
         if (match) {
           const path = match[1] || '';
@@ -1324,22 +1314,24 @@ export class ApiAnalyzer {
   private extractNestMiddleware(content: string, filePath: string): MiddlewareInfo[] {
     const middleware: MiddlewareInfo[] = [];
     const middlewarePattern = /@UseInterceptors\(([^)]+)\)|@UseFilters\(([^)]+)\)|@UsePipes\(([^)]+)\)/g;
+    const lineAt = this.createLineCounter(content);
     
     let match;
     while ((match = middlewarePattern.exec(content)) !== null) {
       const name = match[1] || match[2] || match[3];
+      const lowerName = name.toLowerCase();
       let type: MiddlewareInfo['type'] = 'other';
       
-      if (name.toLowerCase().includes('auth')) type = 'authentication';
-      else if (name.toLowerCase().includes('valid')) type = 'validation';
-      else if (name.toLowerCase().includes('log')) type = 'logging';
-      else if (name.toLowerCase().includes('error')) type = 'error-handling';
+      if (lowerName.includes('auth')) type = 'authentication';
+      else if (lowerName.includes('valid')) type = 'validation';
+      else if (lowerName.includes('log')) type = 'logging';
+      else if (lowerName.includes('error')) type = 'error-handling';
 
       middleware.push({
         name,
         type,
         file: filePath,
-        lineStart: content.substring(0, match.index).split('\n').length,
+        lineStart: lineAt(match.index),
         description: `NestJS middleware: ${name}`,
         global: false
       });
@@ -1403,6 +1395,7 @@ export class ApiAnalyzer {
   private extractFastifyHooks(content: string, filePath: string): MiddlewareInfo[] {
     const hooks: MiddlewareInfo[] = [];
     const hookPattern = /\.addHook\s*\(\s*['"`]([^'"`]+)['"`]\s*,\s*([^)]+)\)/g;
+    const lineAt = this.createLineCounter(content);
     
     let match;
     while ((match = hookPattern.exec(content)) !== null) {
@@ -1410,7 +1403,7 @@ export class ApiAnalyzer {
         name: match[2].trim(),
         type: this.mapFastifyHookType(match[1]),
         file: filePath,
-        lineStart: content.substring(0, match.index).split('\n').length,
+        lineStart: lineAt(match.index),
         description: `Fastify hook: ${match[1]}`,
         global: true
       });
@@ -1452,6 +1445,7 @@ export class ApiAnalyzer {
   private extractKoaMiddleware(content: string, filePath: string): MiddlewareInfo[] {
     const middleware: MiddlewareInfo[] = [];
     const middlewarePattern = /\.use\(\s*([^)]+)\s*\)/g;
+    const lineAt = this.createLineCounter(content);
     
     let match;
     while ((match = middlewarePattern.exec(content)) !== null) {
@@ -1467,7 +1461,7 @@ export class ApiAnalyzer {
         name,
         type,
         file: filePath,
-        lineStart: content.substring(0, match.index).split('\n').length,
+        lineStart: lineAt(match.index),
         description: `Koa middleware: ${name}`,
         global: true
       });
@@ -1500,6 +1494,11 @@ export class ApiAnalyzer {
 
   private extractGraphQLResolvers(content: string, filePath: string, parseResult: ParseResult): RouteInfo[] {
     const resolvers: RouteInfo[] = [];
+
+    // Resolvers are arrow functions; schema-only files have none to scan for
+    if (!content.includes('=>')) {
+      return resolvers;
+    }
     
     // Extract Query and Mutation resolvers
     const resolverPattern = /(\w+)\s*:\s*(async\s+)?\([^)]*\)\s*=>/g;
@@ -1559,6 +1558,7 @@ export class ApiAnalyzer {
     
     if (content.includes('.use(')) {
       const middlewarePattern = /\.use\s*\(\s*([^)]+)\s*\)/g;
+      const lineAt = this.createLineCounter(content);
       let match;
       
       while ((match = middlewarePattern.exec(content)) !== null) {
@@ -1566,7 +1566,7 @@ export class ApiAnalyzer {
           name: match[1].trim(),
           type: 'other',
           file: filePath,
-          lineStart: content.substring(0, match.index).split('\n').length,
+          lineStart: lineAt(match.index),
           description: `Socket.IO middleware: ${match[1].trim()}`,
           global: true
         });
@@ -1580,17 +1580,36 @@ export class ApiAnalyzer {
     return []; // Basic implementation - can be expanded
   }
 
+  // Maps increasing match offsets to 1-based line numbers without re-splitting the content per match
+  private createLineCounter(content: string): (index: number) => number {
+    let line = 1;
+    let offset = 0;
+
+    return (index: number) => {
+      let next = content.indexOf('\n', offset);
+      while (next !== -1 && next < index) {
+        line++;
+        offset = next + 1;
+        next = content.indexOf('\n', offset);
+      }
+      return line;
+    };
+  }
+
   private mergeFrameworkInfo(map: Map<string, ServerFrameworkInfo>, framework: string, partial: Partial<ServerFrameworkInfo>): void {
     const existing = map.get(framework);
     if (existing) {
       existing.files.push(...(partial.files || []));
       existing.middleware.push(...(partial.middleware || []));
       existing.routes.push(...(partial.routes || []));
+      // Append in place rather than concat-copying the accumulated lists for every file
       if (partial.plugins) {
-        existing.plugins = (existing.plugins || []).concat(partial.plugins);
+        if (existing.plugins) existing.plugins.push(...partial.plugins);
+        else existing.plugins = partial.plugins;
       }
       if (partial.decorators) {
-        existing.decorators = (existing.decorators || []).concat(partial.decorators);
+        if (existing.decorators) existing.decorators.push(...partial.decorators);
+        else existing.decorators = partial.decorators;
       }
       existing.configuration.push(...(partial.configuration || []));
     } else {
@@ -1607,63 +1626,102 @@ export class ApiAnalyzer {
   }
 
   private analyzeApiArchitecture(endpoints: EndpointInfo[]): ApiArchitectureInfo {
+    const { restfulDesign, apiVersioning, pagination } = this.analyzeEndpointPatterns(endpoints);
+
     return {
-      restfulDesign: this.analyzeRestfulDesign(endpoints),
-      apiVersioning: this.analyzeApiVersioning(endpoints),
+      restfulDesign,
+      apiVersioning,
       documentation: this.analyzeApiDocumentation(),
       rateLimiting: this.analyzeRateLimiting(),
       caching: this.analyzeCaching(),
       cors: this.analyzeCors(),
       contentNegotiation: this.analyzeContentNegotiation(),
-      pagination: this.analyzePagination(endpoints)
+      pagination
     };
   }
 
-  private analyzeRestfulDesign(endpoints: EndpointInfo[]): RestfulDesignInfo {
+  // RESTful design, URL versioning and pagination all come from a single pass over the endpoints
+  private analyzeEndpointPatterns(endpoints: EndpointInfo[]): {
+    restfulDesign: RestfulDesignInfo;
+    apiVersioning: ApiVersioningInfo;
+    pagination: PaginationInfo;
+  } {
     let totalScore = 0;
     const violations: Array<{endpoint: string; issue: string; suggestion: string}> = [];
     const resourceNaming: Array<{resource: string; endpoints: string[]; score: number}> = [];
     const httpMethodUsage: Record<string, {count: number; appropriate: boolean}> = {};
 
-    // Analyze each endpoint for RESTful compliance
+    const versions = new Set<string>();
+    let versioningStrategy: ApiVersioningInfo['strategy'] = 'none';
+    const versioningImplementation: Array<{version: string; files: string[]}> = [];
+
+    let paginationStrategy: PaginationInfo['strategy'] = 'none';
+    const paginationImplementation: Array<{endpoint: string; method: string}> = [];
+
     for (const endpoint of endpoints) {
+      const { method, path } = endpoint;
+
+      // Analyze each endpoint for RESTful compliance
       let endpointScore = 0;
-      const fullEndpoint = `${endpoint.method} ${endpoint.path}`;
 
       // Check HTTP method usage
-      httpMethodUsage[endpoint.method] = httpMethodUsage[endpoint.method] || {count: 0, appropriate: true};
-      httpMethodUsage[endpoint.method].count++;
+      const usage = httpMethodUsage[method] || (httpMethodUsage[method] = {count: 0, appropriate: true});
+      usage.count++;
 
       // Check for RESTful patterns
-      if (this.isRestfulPath(endpoint.path)) endpointScore += 2;
-      if (this.hasAppropriateMethod(endpoint.method, endpoint.path)) endpointScore += 2;
+      if (this.isRestfulPath(path)) endpointScore += 2;
+      if (this.hasAppropriateMethod(method, path)) endpointScore += 2;
       else {
         violations.push({
-          endpoint: fullEndpoint,
+          endpoint: `${method} ${path}`,
           issue: 'HTTP method not appropriate for endpoint',
-          suggestion: this.suggestAppropriateMethod(endpoint.path)
+          suggestion: this.suggestAppropriateMethod(path)
         });
       }
 
       totalScore += endpointScore;
+
+      // Check for URL path versioning (cheap substring test first; most paths are unversioned)
+      const pathVersionMatch = path.includes('/v') ? path.match(this.apiVersionPattern) : null;
+      if (pathVersionMatch) {
+        versioningStrategy = 'url-path';
+        versions.add(pathVersionMatch[1]);
+      }
+
+      // Check for pagination parameters
+      if (path.includes('page') || path.includes('offset')) {
+        paginationStrategy = path.includes('page') ? 'page' : 'offset';
+        paginationImplementation.push({
+          endpoint: path,
+          method: paginationStrategy
+        });
+      }
     }
 
     return {
-      adherenceScore: endpoints.length > 0 ? Math.round((totalScore / (endpoints.length * 4)) * 100) : 0,
-      violations,
-      resourceNaming,
-      httpMethodUsage
+      restfulDesign: {
+        adherenceScore: endpoints.length > 0 ? Math.round((totalScore / (endpoints.length * 4)) * 100) : 0,
+        violations,
+        resourceNaming,
+        httpMethodUsage
+      },
+      apiVersioning: {
+        strategy: versioningStrategy,
+        versions: Array.from(versions),
+        implementation: versioningImplementation,
+        deprecations: []
+      },
+      pagination: {
+        strategy: paginationStrategy,
+        implementation: paginationImplementation,
+        metadata: false
+      }
     };
   }
 
   private isRestfulPath(path: string): boolean {
     // RESTful paths should be noun-based, use plural forms, and follow /resource/{id}/subresource pattern
-    const restfulPatterns = [
-      /^\/[a-z]+s(\/\{[^}]+\})?(\/[a-z]+s?)?(\/\{[^}]+\})?$/i, // /users/{id}/posts/{postId}
-      /^\/api\/v\d+\/[a-z]+s/i // /api/v1/users
-    ];
-    
-    return restfulPatterns.some(pattern => pattern.test(path));
+    return this.restfulPathPatterns.some(pattern => pattern.test(path));
   }
 
   private hasAppropriateMethod(method: string, path: string): boolean {
@@ -1683,28 +1741,6 @@ export class ApiAnalyzer {
     return 'Review HTTP method selection';
   }
 
-  private analyzeApiVersioning(endpoints: EndpointInfo[]): ApiVersioningInfo {
-    const versions = new Set<string>();
-    let strategy: ApiVersioningInfo['strategy'] = 'none';
-    const implementation: Array<{version: string; files: string[]}> = [];
-
-    for (const endpoint of endpoints) {
-      // Check for URL path versioning
-      const pathVersionMatch = endpoint.path.match(/\/v(\d+(?:\.\d+)?)\//);
-      if (pathVersionMatch) {
-        strategy = 'url-path';
-        versions.add(pathVersionMatch[1]);
-      }
-    }
-
-    return {
-      strategy,
-      versions: Array.from(versions),
-      implementation,
-      deprecations: []
-    };
-  }
-
   private analyzeApiDocumentation(): ApiDocumentationInfo {
     let type: ApiDocumentationInfo['type'] = 'none';
     const files: string[] = [];
@@ -1818,27 +1854,6 @@ export class ApiAnalyzer {
     };
   }
 
-  private analyzePagination(endpoints: EndpointInfo[]): PaginationInfo {
-    let strategy: PaginationInfo['strategy'] = 'none';
-    const implementation: Array<{endpoint: string; method: string}> = [];
-
-    for (const endpoint of endpoints) {
-      if (endpoint.path.includes('page') || endpoint.path.includes('offset')) {
-        strategy = endpoint.path.includes('page') ? 'page' : 'offset';
-        implementation.push({
-          endpoint: endpoint.path,
-          method: strategy
-        });
-      }
-    }
-
-    return {
-      strategy,
-      implementation,
-      metadata: false
-    };
-  }
-
   private analyzeSecurityPatterns(): SecurityAnalysisInfo {
     return {
       authentication: this.analyzeAuthenticationSecurity(),
@@ -1880,23 +1895,27 @@ export class ApiAnalyzer {
   }
 
   private analyzeInputValidation(): InputValidationInfo {
-    const frameworks: string[] = [];
+    // Collected into a Set as they're found (first-seen order) instead of pushing a label per file
+    // and deduplicating at the end; once all four are found the remaining files can't add anything
+    const frameworks = new Set<string>();
     let coverage = 0;
 
     for (const [filePath] of Object.entries(this.parserResults)) {
+      if (frameworks.size === 4) break;
+
       const fileContent = this.getFileContent(filePath);
       if (!fileContent) continue;
 
-      if (fileContent.includes('joi')) frameworks.push('Joi');
-      if (fileContent.includes('yup')) frameworks.push('Yup');
-      if (fileContent.includes('zod')) frameworks.push('Zod');
+      if (fileContent.includes('joi')) frameworks.add('Joi');
+      if (fileContent.includes('yup')) frameworks.add('Yup');
+      if (fileContent.includes('zod')) frameworks.add('Zod');
       if (fileContent.includes('@IsString') || fileContent.includes('class-validator')) {
-        frameworks.push('class-validator');
+        frameworks.add('class-validator');
       }
     }
 
     return {
-      frameworks: [...new Set(frameworks)],
+      frameworks: Array.from(frameworks),
       coverage,
       validatedEndpoints: [],
       vulnerabilities: []
@@ -1,4 +1,5 @@
 import * as fs from 'fs';
+import * as path from 'path';
 import { 
   FileInfo, 
   ParseResult, 
@@ -15,6 +16,18 @@ export class BusinessLogicContextAnalyzer {
   private repoPath: string;
   private fileData: FileInfo[];
   private parserResults: Record<string, ParseResult>;
+  // Name keyword tables as single alternations, so each name is scanned once instead of once per keyword.
+  // Names are lowercased before matching, as the keyword lists are.
+  private workflowKeywordPattern = /process|handle|execute|run|perform|create|update|submit|approve|reject|complete|finish|start|initialize/;
+  private stepKeywordPattern = /validate|save|send|notify|calculate|transform|create|update|delete|fetch|process|handle/;
+  private modelKeywordPattern = /model|entity|schema|dto|data|type|user|order|product|customer|account/;
+  private calculationKeywordPattern = /calculate|compute|sum|total|average|count|tax|discount|price|cost|amount|fee/;
+  // Path segments (lowercased) that mark a domain directory, and generic ones that never do
+  private domainIndicators = new Set([
+    'components', 'pages', 'services', 'models', 'controllers',
+    'views', 'api', 'routes', 'handlers', 'utils', 'core'
+  ]);
+  private genericDirectoryNames = new Set(['src', 'lib', 'test', 'spec']);
 
   constructor(repoPath: string, fileData: FileInfo[], parserResults: Record<string, ParseResult>) {
     this.repoPath = repoPath;
@@ -170,11 +183,12 @@ export class BusinessLogicContextAnalyzer {
       'admin', 'dashboard', 'api', 'service', 'core', 'shared'
     ];
 
+    // Lowercase every path once rather than once per keyword. A plural form ('users') always contains
+    // its keyword, so the keyword check alone covers it.
+    const lowerCasePaths = this.fileData.map(f => f.path.toLowerCase());
+
     for (const keyword of domainKeywords) {
-      const domainFiles = this.fileData.filter(f => 
-        f.path.toLowerCase().includes(keyword) ||
-        f.path.toLowerCase().includes(`${keyword}s`) // plural form
-      );
+      const domainFiles = this.fileData.filter((f, i) => lowerCasePaths[i].includes(keyword));
 
       if (domainFiles.length >= 2) { // Minimum threshold for a domain
         const entities = this.extractDomainEntities(domainFiles, keyword);
@@ -552,13 +566,9 @@ export class BusinessLogicContextAnalyzer {
   }
 
   private isDomainDirectory(dirName: string): boolean {
-    const domainIndicators = [
-      'components', 'pages', 'services', 'models', 'controllers',
-      'views', 'api', 'routes', 'handlers', 'utils', 'core'
-    ];
-    
-    return domainIndicators.includes(dirName.toLowerCase()) ||
-           dirName.length > 3 && !['src', 'lib', 'test', 'spec'].includes(dirName.toLowerCase());
+    const lowerName = dirName.toLowerCase();
+    return this.domainIndicators.has(lowerName) ||
+           dirName.length > 3 && !this.genericDirectoryNames.has(lowerName);
   }
 
   private extractDomainEntities(files: FileInfo[], domain: string): string[] {
@@ -585,9 +595,10 @@ export class BusinessLogicContextAnalyzer {
     const services: string[] = [];
 
     for (const file of files) {
-      if (file.path.toLowerCase().includes('service') ||
-          file.path.toLowerCase().includes('api') ||
-          file.path.toLowerCase().includes('handler')) {
+      const lowerPath = file.path.toLowerCase();
+      if (lowerPath.includes('service') ||
+          lowerPath.includes('api') ||
+          lowerPath.includes('handler')) {
         services.push(file.path);
       }
     }
@@ -636,13 +647,7 @@ export class BusinessLogicContextAnalyzer {
   }
 
   private isWorkflowFunction(functionName: string): boolean {
-    const workflowKeywords = [
-      'process', 'handle', 'execute', 'run', 'perform', 'create', 'update',
-      'submit', 'approve', 'reject', 'complete', 'finish', 'start', 'initialize'
-    ];
-
-    const lowerName = functionName.toLowerCase();
-    return workflowKeywords.some(keyword => lowerName.includes(keyword));
+    return this.workflowKeywordPattern.test(functionName.toLowerCase());
   }
 
   private analyzeWorkflowFunction(func: any, filePath: string, parseResult: ParseResult): WorkflowInfo | null {
@@ -691,13 +696,7 @@ export class BusinessLogicContextAnalyzer {
   }
 
   private isWorkflowStep(functionName: string): boolean {
-    const stepKeywords = [
-      'validate', 'save', 'send', 'notify', 'calculate', 'transform',
-      'create', 'update', 'delete', 'fetch', 'process', 'handle'
-    ];
-
-    const lowerName = functionName.toLowerCase();
-    return stepKeywords.some(keyword => lowerName.includes(keyword));
+    return this.stepKeywordPattern.test(functionName.toLowerCase());
   }
 
   private extractStepDependencies(line: string): string[] {
@@ -806,13 +805,7 @@ export class BusinessLogicContextAnalyzer {
   }
 
   private isDataModel(name: string): boolean {
-    const modelKeywords = [
-      'model', 'entity', 'schema', 'dto', 'data', 'type',
-      'user', 'order', 'product', 'customer', 'account'
-    ];
-
-    const lowerName = name.toLowerCase();
-    return modelKeywords.some(keyword => lowerName.includes(keyword));
+    return this.modelKeywordPattern.test(name.toLowerCase());
   }
 
   private isDataModelClass(name: string): boolean {
@@ -820,13 +813,7 @@ export class BusinessLogicContextAnalyzer {
   }
 
   private isCalculationFunction(name: string): boolean {
-    const calculationKeywords = [
-      'calculate', 'compute', 'sum', 'total', 'average', 'count',
-      'tax', 'discount', 'price', 'cost', 'amount', 'fee'
-    ];
-
-    const lowerName = name.toLowerCase();
-    return calculationKeywords.some(keyword => lowerName.includes(keyword));
+    return this.calculationKeywordPattern.test(name.toLowerCase());
   }
 
   private inferCalculationPurpose(name: string, content: string): string {
@@ -942,7 +929,7 @@ export class BusinessLogicContextAnalyzer {
 
   private getFileContent(filePath: string): string | null {
     try {
-      const fullPath = require('path').join(this.repoPath, filePath);
+      const fullPath = path.join(this.repoPath, filePath);
       return fs.readFileSync(fullPath, 'utf-8');
     } catch {
       return null;
@@ -1,16 +1,23 @@
 import * as fs from 'fs';
 import * as path from 'path';
 import { FileInfo, ParseResult, CodePatternsAnalysis, CodePatternInfo } from '../types';
+import { FileContentCache } from '../utils';
 
 export class CodePatternsAnalyzer {
   private repoPath: string;
   private fileData: FileInfo[];
   private parserResults: Record<string, ParseResult>;
+  // File contents by relative path (null when unreadable). Dozens of detectors scan the same files,
+  // so each file is read from disk once per analysis instead of once per detector.
+  private fileContents: FileContentCache;
+  // Lowercased fileData paths (same order), shared by the case-insensitive path detectors
+  private lowerCasePaths: string[] | null = null;
 
   constructor(repoPath: string, fileData: FileInfo[], parserResults: Record<string, ParseResult>) {
     this.repoPath = repoPath;
     this.fileData = fileData;
     this.parserResults = parserResults;
+    this.fileContents = new FileContentCache(repoPath, fileData);
   }
 
   public analyze(): CodePatternsAnalysis {
@@ -133,34 +140,39 @@ export class CodePatternsAnalyzer {
   }
 
   private detectMVCPattern(): CodePatternInfo | null {
-    const hasControllers = this.fileData.some(file => 
-      file.path.toLowerCase().includes('controller') ||
-      file.path.toLowerCase().includes('ctrl')
-    );
-
-    const hasModels = this.fileData.some(file => 
-      file.path.toLowerCase().includes('model') ||
-      file.path.toLowerCase().includes('entity')
-    );
-
-    const hasViews = this.fileData.some(file => 
-      file.path.toLowerCase().includes('view') ||
-      file.path.toLowerCase().includes('component') ||
-      file.extension === '.html' ||
-      file.extension === '.jsx' ||
-      file.extension === '.tsx'
-    );
+    // One pass classifies every file and lowercases each path once
+    let hasControllers = false;
+    let hasModels = false;
+    let hasViews = false;
+    const mvcFiles: string[] = [];
+
+    const lowerCasePaths = this.getLowerCasePaths();
+    for (let i = 0; i < this.fileData.length; i++) {
+      const file = this.fileData[i];
+      const lowerPath = lowerCasePaths[i];
+      const isController = lowerPath.includes('controller');
+      const isModel = lowerPath.includes('model');
+      const isView = lowerPath.includes('view');
+
+      hasControllers = hasControllers || isController || lowerPath.includes('ctrl');
+      hasModels = hasModels || isModel || lowerPath.includes('entity');
+      hasViews = hasViews || isView ||
+        lowerPath.includes('component') ||
+        file.extension === '.html' ||
+        file.extension === '.jsx' ||
+        file.extension === '.tsx';
+
+      if (isController || isModel || isView) {
+        mvcFiles.push(file.path);
+      }
+    }
 
     if (hasControllers && hasModels && hasViews) {
       return {
         pattern: 'MVC Architecture',
         type: 'architectural',
         description: 'Model-View-Controller architectural pattern detected',
-        files: this.fileData.filter(f => 
-          f.path.toLowerCase().includes('controller') ||
-          f.path.toLowerCase().includes('model') ||
-          f.path.toLowerCase().includes('view')
-        ).map(f => f.path),
+        files: mvcFiles,
         examples: []
       };
     }
@@ -170,18 +182,34 @@ export class CodePatternsAnalyzer {
 
   private detectLayeredArchitecture(): CodePatternInfo | null {
     const layers = ['controller', 'service', 'repository', 'model', 'dto'];
-    const detectedLayers = layers.filter(layer => 
-      this.fileData.some(file => file.path.toLowerCase().includes(layer))
-    );
+    const presentLayers = new Set<string>();
+    // A file matching any layer marks that layer as detected, so the matching files are exactly
+    // the files of the detected layers
+    const layerFiles: string[] = [];
+
+    const lowerCasePaths = this.getLowerCasePaths();
+    for (let i = 0; i < this.fileData.length; i++) {
+      const lowerPath = lowerCasePaths[i];
+      let matched = false;
+      for (const layer of layers) {
+        if (lowerPath.includes(layer)) {
+          presentLayers.add(layer);
+          matched = true;
+        }
+      }
+      if (matched) {
+        layerFiles.push(this.fileData[i].path);
+      }
+    }
+
+    const detectedLayers = layers.filter(layer => presentLayers.has(layer));
 
     if (detectedLayers.length >= 3) {
       return {
         pattern: 'Layered Architecture',
         type: 'architectural',
         description: `Layered architecture with ${detectedLayers.length} layers: ${detectedLayers.join(', ')}`,
-        files: this.fileData.filter(f => 
-          detectedLayers.some(layer => f.path.toLowerCase().includes(layer))
-        ).map(f => f.path),
+        files: layerFiles,
         examples: []
       };
     }
@@ -190,15 +218,18 @@ export class CodePatternsAnalyzer {
   }
 
   private detectMicroservicesPattern(): CodePatternInfo | null {
-    // Look for multiple package.json files or service directories
-    const packageJsonFiles = this.fileData.filter(f => f.path.endsWith('package.json'));
-    const serviceDirectories = new Set(
-      this.fileData
-        .filter(f => f.path.includes('service') || f.path.includes('microservice'))
-        .map(f => f.path.split('/')[0])
-    );
+    // Look for multiple package.json files or service directories, counting in one pass
+    // rather than materializing filtered copies of the file list
+    let packageJsonCount = 0;
+    const serviceDirectories = new Set<string>();
+    for (const f of this.fileData) {
+      if (f.path.endsWith('package.json')) packageJsonCount++;
+      if (f.path.includes('service')) {
+        serviceDirectories.add(f.path.split('/')[0]);
+      }
+    }
 
-    if (packageJsonFiles.length > 1 || serviceDirectories.size > 1) {
+    if (packageJsonCount > 1 || serviceDirectories.size > 1) {
       return {
         pattern: 'Microservices Architecture',
         type: 'architectural',
@@ -256,14 +287,21 @@ export class CodePatternsAnalyzer {
 
   private checkFileNamingConsistency(): CodePatternInfo[] {
     const patterns: CodePatternInfo[] = [];
-    const kebabCaseFiles = this.fileData.filter(f => this.isKebabCase(path.basename(f.path, f.extension)));
-    const camelCaseFiles = this.fileData.filter(f => this.isCamelCase(path.basename(f.path, f.extension)));
-    const pascalCaseFiles = this.fileData.filter(f => this.isPascalCase(path.basename(f.path, f.extension)));
+    // Strip each file name once and tally all three conventions from it
+    let kebabCount = 0;
+    let camelCount = 0;
+    let pascalCount = 0;
+    for (const f of this.fileData) {
+      const baseName = path.basename(f.path, f.extension);
+      if (this.isKebabCase(baseName)) kebabCount++;
+      if (this.isCamelCase(baseName)) camelCount++;
+      if (this.isPascalCase(baseName)) pascalCount++;
+    }
 
     const total = this.fileData.length;
-    const kebabRatio = kebabCaseFiles.length / total;
-    const camelRatio = camelCaseFiles.length / total;
-    const pascalRatio = pascalCaseFiles.length / total;
+    const kebabRatio = kebabCount / total;
+    const camelRatio = camelCount / total;
+    const pascalRatio = pascalCount / total;
 
     // If no single convention dominates (>60%), flag as inconsistent
     if (kebabRatio < 0.6 && camelRatio < 0.6 && pascalRatio < 0.6) {
@@ -563,29 +601,27 @@ export class CodePatternsAnalyzer {
     const magicNumbers: Array<{file: string, line: number, code: string}> = [];
 
     for (const [filePath] of Object.entries(this.parserResults)) {
-      try {
-        const content = fs.readFileSync(path.join(this.repoPath, filePath), 'utf-8');
-        const lines = content.split('\n');
-
-        for (let i = 0; i < lines.length; i++) {
-          const line = lines[i];
-          // Look for numeric literals that might be magic numbers
-          const numberMatches = line.match(/\b(\d{2,})\b/g);
-          if (numberMatches) {
-            for (const num of numberMatches) {
-              // Skip common non-magic numbers
-              if (!['100', '200', '300', '400', '500', '1000', '0', '1', '2'].includes(num)) {
-                magicNumbers.push({
-                  file: filePath,
-                  line: i + 1,
-                  code: `Magic number: ${num}`
-                });
-              }
+      const content = this.getFileContent(filePath);
+      if (content === null) continue;
+
+      const lines = content.split('\n');
+
+      for (let i = 0; i < lines.length; i++) {
+        const line = lines[i];
+        // Look for numeric literals that might be magic numbers
+        const numberMatches = line.match(/\b(\d{2,})\b/g);
+        if (numberMatches) {
+          for (const num of numberMatches) {
+            // Skip common non-magic numbers
+            if (!['100', '200', '300', '400', '500', '1000', '0', '1', '2'].includes(num)) {
+              magicNumbers.push({
+                file: filePath,
+                line: i + 1,
+                code: `Magic number: ${num}`
+              });
             }
           }
         }
-      } catch (error) {
-        // Skip files that can't be read
       }
     }
 
@@ -1311,9 +1347,7 @@ export class CodePatternsAnalyzer {
     const mvvmFiles: string[] = [];
 
     // Look for MVVM indicators
-    const hasViewModels = this.fileData.some(file => 
-      file.path.toLowerCase().includes('viewmodel')
-    );
+    const hasViewModels = this.getLowerCasePaths().some(lowerPath => lowerPath.includes('viewmodel'));
     const hasDataBinding = this.getFilesWithPattern(/@bind|v-model|\[\(ngModel\)\]/);
     const hasMVVMFramework = this.getFilesWithPattern(/import.*from\s+['"](@angular\/core|vue|knockout)['"]/);
 
@@ -1337,9 +1371,7 @@ export class CodePatternsAnalyzer {
     const patterns: CodePatternInfo[] = [];
     const mvpFiles: string[] = [];
 
-    const hasPresenters = this.fileData.some(file => 
-      file.path.toLowerCase().includes('presenter')
-    );
+    const hasPresenters = this.getLowerCasePaths().some(lowerPath => lowerPath.includes('presenter'));
     const hasViewInterfaces = this.getFilesWithPattern(/interface.*View\s*\{/);
 
     if (hasPresenters || hasViewInterfaces.length > 0) {
@@ -1737,13 +1769,9 @@ export class CodePatternsAnalyzer {
     const matchedFiles: string[] = [];
 
     for (const [filePath] of Object.entries(this.parserResults)) {
-      try {
-        const content = fs.readFileSync(path.join(this.repoPath, filePath), 'utf-8');
-        if (pattern.test(content)) {
-          matchedFiles.push(filePath);
-        }
-      } catch (error) {
-        // Skip files that can't be read
+      const content = this.getFileContent(filePath);
+      if (content !== null && pattern.test(content)) {
+        matchedFiles.push(filePath);
       }
     }
 
@@ -1754,63 +1782,90 @@ export class CodePatternsAnalyzer {
     const examples: Array<{file: string, line: number, code: string}> = [];
 
     for (const filePath of files) {
-      try {
-        const content = fs.readFileSync(path.join(this.repoPath, filePath), 'utf-8');
-        const lines = content.split('\n');
-
-        for (let i = 0; i < lines.length; i++) {
-          const line = lines[i];
-          const match = line.match(pattern);
-          if (match) {
-            examples.push({
-              file: filePath,
-              line: i + 1,
-              code: line.trim()
-            });
-            break; // Only first match per file
-          }
+      const content = this.getFileContent(filePath);
+      if (content === null) continue;
+
+      const lines = content.split('\n');
+
+      for (let i = 0; i < lines.length; i++) {
+        const line = lines[i];
+        const match = line.match(pattern);
+        if (match) {
+          examples.push({
+            file: filePath,
+            line: i + 1,
+            code: line.trim()
+          });
+          break; // Only first match per file
         }
-      } catch (error) {
-        // Skip files that can't be read
       }
     }
 
     return examples;
   }
 
+  private getLowerCasePaths(): string[] {
+    if (!this.lowerCasePaths) {
+      this.lowerCasePaths = this.fileData.map(f => f.path.toLowerCase());
+    }
+    return this.lowerCasePaths;
+  }
+
+  private getFileContent(filePath: string): string | null {
+    return this.fileContents.get(filePath);
+  }
+
   private detectBuildToolPatterns(): CodePatternInfo[] {
     const patterns: CodePatternInfo[] = [];
 
+    // Classify config files for every build tool, and find the root package.json, in one pass
+    const viteConfigFiles: FileInfo[] = [];
+    const webpackConfigFiles: FileInfo[] = [];
+    const rollupConfigFiles: FileInfo[] = [];
+    const esbuildConfigFiles: FileInfo[] = [];
+    let packageJsonFile: FileInfo | undefined;
+
+    for (const f of this.fileData) {
+      if (f.path.includes('vite.config') || f.path.includes('vitest.config')) viteConfigFiles.push(f);
+      if (f.path.includes('webpack.')) webpackConfigFiles.push(f);
+      if (f.path.includes('rollup.config')) rollupConfigFiles.push(f);
+      if (f.path.includes('esbuild')) esbuildConfigFiles.push(f);
+      if (!packageJsonFile && f.path === 'package.json') packageJsonFile = f;
+    }
+
+    // Read and parse package.json once for the dependency checks and the scripts pattern
+    const packageJson = packageJsonFile ? this.readPackageJson(packageJsonFile) : null;
+    const packageDependencies = packageJson ? Object.keys({
+      ...packageJson.dependencies,
+      ...packageJson.devDependencies,
+      ...packageJson.peerDependencies
+    }) : [];
+
     // Detect Vite
-    const vitePattern = this.detectVite();
+    const vitePattern = this.detectVite(viteConfigFiles, packageDependencies);
     if (vitePattern) patterns.push(vitePattern);
 
     // Detect Webpack
-    const webpackPattern = this.detectWebpack();
+    const webpackPattern = this.detectWebpack(webpackConfigFiles, packageDependencies);
     if (webpackPattern) patterns.push(webpackPattern);
 
     // Detect Rollup
-    const rollupPattern = this.detectRollup();
+    const rollupPattern = this.detectRollup(rollupConfigFiles, packageDependencies);
     if (rollupPattern) patterns.push(rollupPattern);
 
     // Detect ESBuild
-    const esbuildPattern = this.detectESBuild();
+    const esbuildPattern = this.detectESBuild(esbuildConfigFiles, packageDependencies);
     if (esbuildPattern) patterns.push(esbuildPattern);
 
     // Detect package.json scripts patterns
-    const scriptsPattern = this.detectPackageJsonScripts();
+    const scriptsPattern = this.detectPackageJsonScripts(packageJsonFile, packageJson);
     if (scriptsPattern) patterns.push(scriptsPattern);
 
     return patterns;
   }
 
-  private detectVite(): CodePatternInfo | null {
-    const viteConfigFiles = this.fileData.filter(f => 
-      f.path.includes('vite.config') || 
-      f.path.includes('vitest.config')
-    );
-
-    const viteInPackageJson = this.checkPackageJsonDependency('vite');
+  private detectVite(viteConfigFiles: FileInfo[], packageDependencies: string[]): CodePatternInfo | null {
+    const viteInPackageJson = this.checkPackageJsonDependency(packageDependencies, 'vite');
 
     if (viteConfigFiles.length > 0 || viteInPackageJson) {
       return {
@@ -1829,15 +1884,8 @@ export class CodePatternsAnalyzer {
     return null;
   }
 
-  private detectWebpack(): CodePatternInfo | null {
-    const webpackConfigFiles = this.fileData.filter(f => 
-      f.path.includes('webpack.config') ||
-      f.path.includes('webpack.') ||
-      f.path === 'webpack.config.js' ||
-      f.path === 'webpack.config.ts'
-    );
-
-    const webpackInPackageJson = this.checkPackageJsonDependency('webpack');
+  private detectWebpack(webpackConfigFiles: FileInfo[], packageDependencies: string[]): CodePatternInfo | null {
+    const webpackInPackageJson = this.checkPackageJsonDependency(packageDependencies, 'webpack');
 
     if (webpackConfigFiles.length > 0 || webpackInPackageJson) {
       return {
@@ -1856,14 +1904,8 @@ export class CodePatternsAnalyzer {
     return null;
   }
 
-  private detectRollup(): CodePatternInfo | null {
-    const rollupConfigFiles = this.fileData.filter(f => 
-      f.path.includes('rollup.config') ||
-      f.path === 'rollup.config.js' ||
-      f.path === 'rollup.config.ts'
-    );
-
-    const rollupInPackageJson = this.checkPackageJsonDependency('rollup');
+  private detectRollup(rollupConfigFiles: FileInfo[], packageDependencies: string[]): CodePatternInfo | null {
+    const rollupInPackageJson = this.checkPackageJsonDependency(packageDependencies, 'rollup');
 
     if (rollupConfigFiles.length > 0 || rollupInPackageJson) {
       return {
@@ -1882,13 +1924,8 @@ export class CodePatternsAnalyzer {
     return null;
   }
 
-  private detectESBuild(): CodePatternInfo | null {
-    const esbuildConfigFiles = this.fileData.filter(f => 
-      f.path.includes('esbuild') ||
-      f.path.includes('.esbuild')
-    );
-
-    const esbuildInPackageJson = this.checkPackageJsonDependency('esbuild');
+  private detectESBuild(esbuildConfigFiles: FileInfo[], packageDependencies: string[]): CodePatternInfo | null {
+    const esbuildInPackageJson = this.checkPackageJsonDependency(packageDependencies, 'esbuild');
 
     if (esbuildConfigFiles.length > 0 || esbuildInPackageJson) {
       return {
@@ -1907,59 +1944,43 @@ export class CodePatternsAnalyzer {
     return null;
   }
 
-  private detectPackageJsonScripts(): CodePatternInfo | null {
-    const packageJsonFile = this.fileData.find(f => f.path === 'package.json');
-    
-    if (!packageJsonFile) return null;
+  private detectPackageJsonScripts(packageJsonFile: FileInfo | undefined, packageJson: any): CodePatternInfo | null {
+    if (!packageJsonFile || !packageJson) return null;
 
-    try {
-      const content = fs.readFileSync(path.join(this.repoPath, packageJsonFile.path), 'utf-8');
-      const packageJson = JSON.parse(content);
-      
-      if (packageJson.scripts && Object.keys(packageJson.scripts).length > 0) {
-        const scripts = Object.keys(packageJson.scripts);
-        const commonPatterns = this.analyzeScriptPatterns(packageJson.scripts);
-        
-        return {
-          pattern: 'Package.json Scripts',
-          type: 'build-tool',
-          description: `Package.json scripts detected: ${scripts.join(', ')}`,
-          files: [packageJsonFile.path],
-          examples: commonPatterns.map(pattern => ({
-            file: packageJsonFile.path,
-            line: 1,
-            code: `${pattern.name}: ${pattern.command}`
-          }))
-        };
-      }
-    } catch (error) {
-      // Skip if can't parse package.json
+    if (packageJson.scripts && Object.keys(packageJson.scripts).length > 0) {
+      const scripts = Object.keys(packageJson.scripts);
+      const commonPatterns = this.analyzeScriptPatterns(packageJson.scripts);
+
+      return {
+        pattern: 'Package.json Scripts',
+        type: 'build-tool',
+        description: `Package.json scripts detected: ${scripts.join(', ')}`,
+        files: [packageJsonFile.path],
+        examples: commonPatterns.map(pattern => ({
+          file: packageJsonFile.path,
+          line: 1,
+          code: `${pattern.name}: ${pattern.command}`
+        }))
+      };
     }
 
     return null;
   }
 
-  private checkPackageJsonDependency(dependencyName: string): boolean {
-    const packageJsonFile = this.fileData.find(f => f.path === 'package.json');
-    
-    if (!packageJsonFile) return false;
-
+  private readPackageJson(packageJsonFile: FileInfo): any {
     try {
       const content = fs.readFileSync(path.join(this.repoPath, packageJsonFile.path), 'utf-8');
-      const packageJson = JSON.parse(content);
-      
-      const deps = {
-        ...packageJson.dependencies,
-        ...packageJson.devDependencies,
-        ...packageJson.peerDependencies
-      };
-      
-      return Object.keys(deps).some(dep => dep.includes(dependencyName));
+      return JSON.parse(content);
     } catch (error) {
-      return false;
+      // Skip if can't parse package.json
+      return null;
     }
   }
 
+  private checkPackageJsonDependency(packageDependencies: string[], dependencyName: string): boolean {
+    return packageDependencies.some(dep => dep.includes(dependencyName));
+  }
+
   private analyzeScriptPatterns(scripts: Record<string, string>): Array<{name: string, command: string}> {
     const patterns: Array<{name: string, command: string}> = [];
     
@@ -2145,10 +2166,11 @@ export class CodePatternsAnalyzer {
     }
 
     // Also check for Kafka-specific environment files
-    const kafkaConfigFiles = this.fileData.filter(f => 
-      f.path.toLowerCase().includes('kafka') ||
-      f.path.toLowerCase().includes('message') ||
-      f.path.toLowerCase().includes('broker')
+    const lowerCasePaths = this.getLowerCasePaths();
+    const kafkaConfigFiles = this.fileData.filter((f, i) => 
+      lowerCasePaths[i].includes('kafka') ||
+      lowerCasePaths[i].includes('message') ||
+      lowerCasePaths[i].includes('broker')
     );
 
     const uniqueFiles = [...new Set([...allConfigFiles, ...kafkaConfigFiles.map(f => f.path)])];
@@ -2656,8 +2678,9 @@ export class CodePatternsAnalyzer {
   private detectDockerPatterns(): CodePatternInfo[] {
     const patterns: CodePatternInfo[] = [];
 
-    const dockerfiles = this.fileData.filter(f => 
-      f.path.toLowerCase().includes('dockerfile') ||
+    const lowerCasePaths = this.getLowerCasePaths();
+    const dockerfiles = this.fileData.filter((f, i) => 
+      lowerCasePaths[i].includes('dockerfile') ||
       f.path.includes('docker-compose') ||
       f.path.includes('.dockerignore')
     );
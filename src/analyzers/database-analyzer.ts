@@ -1,16 +1,51 @@
 import * as fs from 'fs';
 import * as path from 'path';
 import { FileInfo, ParseResult, DatabaseAnalysisInfo, DatabaseSchemaInfo, MigrationInfo, QueryInfo, ConnectionInfo } from '../types';
+import { FileContentCache } from '../utils';
 
 export class DatabaseAnalyzer {
   private repoPath: string;
   private fileData: FileInfo[];
   private parserResults: Record<string, ParseResult>;
+  // Scanned files grouped by extension, so extension-based lookups (.prisma, .sql) skip full scans
+  private filesByExtension = new Map<string, FileInfo[]>();
+  // Parsed file contents by relative path (null when unreadable); schema and query extraction share them
+  private fileContents: FileContentCache;
+  // Query patterns are compiled once. Each table has a combined pattern that matches exactly when
+  // one of its members does, so most lines are rejected with a single regex test.
+  private sqlQueryPatterns = [
+    { pattern: /SELECT\s+.+\s+FROM/i, type: 'select' as const },
+    { pattern: /INSERT\s+INTO/i, type: 'insert' as const },
+    { pattern: /UPDATE\s+.+\s+SET/i, type: 'update' as const },
+    { pattern: /DELETE\s+FROM/i, type: 'delete' as const }
+  ];
+  private sqlQueryPattern = /SELECT\s+.+\s+FROM|INSERT\s+INTO|UPDATE\s+.+\s+SET|DELETE\s+FROM/i;
+  private ormQueryPatterns = [
+    /\.find\(/,
+    /\.findOne\(/,
+    /\.findMany\(/,
+    /\.create\(/,
+    /\.update\(/,
+    /\.delete\(/,
+    /\.query\(/,
+    /\.rawQuery\(/
+  ];
+  private ormQueryPattern = /\.(?:find|findOne|findMany|create|update|delete|query|rawQuery)\(/;
 
   constructor(repoPath: string, fileData: FileInfo[], parserResults: Record<string, ParseResult>) {
     this.repoPath = repoPath;
     this.fileData = fileData;
     this.parserResults = parserResults;
+    this.fileContents = new FileContentCache(repoPath, fileData);
+
+    for (const file of fileData) {
+      const files = this.filesByExtension.get(file.extension);
+      if (files) {
+        files.push(file);
+      } else {
+        this.filesByExtension.set(file.extension, [file]);
+      }
+    }
   }
 
   public analyze(): DatabaseAnalysisInfo {
@@ -29,6 +64,11 @@ export class DatabaseAnalyzer {
     };
   }
 
+  // Read all parsed files concurrently so analyze() finds them in the content cache
+  public async preloadFileContents(): Promise<void> {
+    await this.fileContents.preload(Object.keys(this.parserResults));
+  }
+
   private extractDatabaseSchemas(): DatabaseSchemaInfo[] {
     const schemas: DatabaseSchemaInfo[] = [];
 
@@ -40,11 +80,12 @@ export class DatabaseAnalyzer {
     }
 
     // Look for additional schema files with enhanced ORM support
+    const ormSchemas = this.findORMSchemas();
     schemas.push(...this.findPrismaSchemas());
-    schemas.push(...this.findTypeORMSchemas());
-    schemas.push(...this.findSequelizeSchemas());
-    schemas.push(...this.findMongooseSchemas());
-    schemas.push(...this.findSQLAlchemySchemas());
+    schemas.push(...ormSchemas.typeorm);
+    schemas.push(...ormSchemas.sequelize);
+    schemas.push(...ormSchemas.mongoose);
+    schemas.push(...ormSchemas.sqlalchemy);
     schemas.push(...this.findSQLSchemas());
     schemas.push(...this.findMongoSchemas());
 
@@ -85,8 +126,9 @@ export class DatabaseAnalyzer {
       if (!fileContent) continue;
 
       // Extract SQL queries from code
-      queries.push(...this.extractSQLQueries(filePath, fileContent));
-      queries.push(...this.extractORMQueries(filePath, fileContent));
+      const lines = fileContent.split('\n');
+      queries.push(...this.extractSQLQueries(filePath, lines));
+      queries.push(...this.extractORMQueries(filePath, lines));
     }
 
     return queries;
@@ -125,14 +167,28 @@ export class DatabaseAnalyzer {
       }
     }
 
-    // Check imports in code files
-    for (const [_, parseResult] of Object.entries(this.parserResults)) {
+    // Check imports in code files. Frameworks already found are dropped from the pending list,
+    // and the scan stops once every import-detectable framework has been seen.
+    const importMarkers: Array<[string, string]> = [
+      ['prisma', 'Prisma'],
+      ['typeorm', 'TypeORM'],
+      ['sequelize', 'Sequelize'],
+      ['mongoose', 'Mongoose'],
+      ['knex', 'Knex']
+    ];
+    const pending = importMarkers.filter(([_, framework]) => !frameworks.has(framework));
+
+    for (const parseResult of Object.values(this.parserResults)) {
+      if (pending.length === 0) break;
+
       for (const importInfo of parseResult.imports) {
-        if (importInfo.module.includes('prisma')) frameworks.add('Prisma');
-        if (importInfo.module.includes('typeorm')) frameworks.add('TypeORM');
-        if (importInfo.module.includes('sequelize')) frameworks.add('Sequelize');
-        if (importInfo.module.includes('mongoose')) frameworks.add('Mongoose');
-        if (importInfo.module.includes('knex')) frameworks.add('Knex');
+        for (let i = 0; i < pending.length; i++) {
+          const [moduleName, framework] = pending[i];
+          if (importInfo.module.includes(moduleName)) {
+            frameworks.add(framework);
+            pending.splice(i--, 1);
+          }
+        }
       }
     }
 
@@ -159,7 +215,7 @@ export class DatabaseAnalyzer {
 
   private findPrismaSchemas(): DatabaseSchemaInfo[] {
     const schemas: DatabaseSchemaInfo[] = [];
-    const prismaFiles = this.fileData.filter(file => file.extension === '.prisma');
+    const prismaFiles = this.filesByExtension.get('.prisma') || [];
 
     for (const file of prismaFiles) {
       try {
@@ -175,7 +231,7 @@ export class DatabaseAnalyzer {
 
   private findSQLSchemas(): DatabaseSchemaInfo[] {
     const schemas: DatabaseSchemaInfo[] = [];
-    const sqlFiles = this.fileData.filter(file => file.extension === '.sql');
+    const sqlFiles = this.filesByExtension.get('.sql') || [];
 
     for (const file of sqlFiles) {
       try {
@@ -223,22 +279,16 @@ export class DatabaseAnalyzer {
     return null;
   }
 
-  private extractSQLQueries(filePath: string, content: string): QueryInfo[] {
+  private extractSQLQueries(filePath: string, lines: string[]): QueryInfo[] {
     const queries: QueryInfo[] = [];
-    const lines = content.split('\n');
 
     for (let i = 0; i < lines.length; i++) {
       const line = lines[i];
       
       // Look for SQL query patterns
-      const sqlPatterns = [
-        { pattern: /SELECT\s+.+\s+FROM/i, type: 'select' as const },
-        { pattern: /INSERT\s+INTO/i, type: 'insert' as const },
-        { pattern: /UPDATE\s+.+\s+SET/i, type: 'update' as const },
-        { pattern: /DELETE\s+FROM/i, type: 'delete' as const }
-      ];
-
-      for (const { pattern, type } of sqlPatterns) {
+      if (!this.sqlQueryPattern.test(line)) continue;
+
+      for (const { pattern, type } of this.sqlQueryPatterns) {
         if (pattern.test(line)) {
           queries.push({
             content: line.trim(),
@@ -253,26 +303,16 @@ export class DatabaseAnalyzer {
     return queries;
   }
 
-  private extractORMQueries(filePath: string, content: string): QueryInfo[] {
+  private extractORMQueries(filePath: string, lines: string[]): QueryInfo[] {
     const queries: QueryInfo[] = [];
-    const lines = content.split('\n');
 
     for (let i = 0; i < lines.length; i++) {
       const line = lines[i];
       
       // Look for ORM query patterns
-      const ormPatterns = [
-        /\.find\(/,
-        /\.findOne\(/,
-        /\.findMany\(/,
-        /\.create\(/,
-        /\.update\(/,
-        /\.delete\(/,
-        /\.query\(/,
-        /\.rawQuery\(/
-      ];
-
-      for (const pattern of ormPatterns) {
+      if (!this.ormQueryPattern.test(line)) continue;
+
+      for (const pattern of this.ormQueryPatterns) {
         if (pattern.test(line)) {
           queries.push({
             content: line.trim(),
@@ -375,12 +415,7 @@ export class DatabaseAnalyzer {
   }
 
   private getFileContent(filePath: string): string | null {
-    try {
-      const fullPath = path.join(this.repoPath, filePath);
-      return fs.readFileSync(fullPath, 'utf-8');
-    } catch {
-      return null;
-    }
+    return this.fileContents.get(filePath);
   }
 
   private extractDatabaseType(url: string): string {
@@ -422,70 +457,47 @@ export class DatabaseAnalyzer {
 
   // Enhanced ORM Schema Detection Methods
 
-  private findTypeORMSchemas(): DatabaseSchemaInfo[] {
-    const schemas: DatabaseSchemaInfo[] = [];
-
-    for (const [filePath, parseResult] of Object.entries(this.parserResults)) {
+  // Reads each file once and only runs an ORM's parser when that ORM's markers are present.
+  // Results stay grouped per ORM so callers can keep the TypeORM, Sequelize, Mongoose, SQLAlchemy order.
+  private findORMSchemas(): {
+    typeorm: DatabaseSchemaInfo[],
+    sequelize: DatabaseSchemaInfo[],
+    mongoose: DatabaseSchemaInfo[],
+    sqlalchemy: DatabaseSchemaInfo[]
+  } {
+    const typeorm: DatabaseSchemaInfo[] = [];
+    const sequelize: DatabaseSchemaInfo[] = [];
+    const mongoose: DatabaseSchemaInfo[] = [];
+    const sqlalchemy: DatabaseSchemaInfo[] = [];
+
+    for (const filePath of Object.keys(this.parserResults)) {
       const fileContent = this.getFileContent(filePath);
       if (!fileContent) continue;
 
       // Check for TypeORM Entity decorator
       if (fileContent.includes('@Entity(') || fileContent.includes('import') && fileContent.includes('typeorm')) {
-        schemas.push(...this.parseTypeORMEntities(filePath, fileContent));
+        typeorm.push(...this.parseTypeORMEntities(filePath, fileContent));
       }
-    }
-
-    return schemas;
-  }
-
-  private findSequelizeSchemas(): DatabaseSchemaInfo[] {
-    const schemas: DatabaseSchemaInfo[] = [];
-
-    for (const [filePath, parseResult] of Object.entries(this.parserResults)) {
-      const fileContent = this.getFileContent(filePath);
-      if (!fileContent) continue;
 
       // Check for Sequelize model definitions
       if (fileContent.includes('sequelize.define') || fileContent.includes('DataTypes') || 
           fileContent.includes('Model.init')) {
-        schemas.push(...this.parseSequelizeModels(filePath, fileContent));
+        sequelize.push(...this.parseSequelizeModels(filePath, fileContent));
       }
-    }
-
-    return schemas;
-  }
-
-  private findMongooseSchemas(): DatabaseSchemaInfo[] {
-    const schemas: DatabaseSchemaInfo[] = [];
-
-    for (const [filePath, parseResult] of Object.entries(this.parserResults)) {
-      const fileContent = this.getFileContent(filePath);
-      if (!fileContent) continue;
 
       // Check for Mongoose schema definitions
       if (fileContent.includes('mongoose.Schema') || fileContent.includes('Schema(')) {
-        schemas.push(...this.parseMongooseSchemas(filePath, fileContent));
+        mongoose.push(...this.parseMongooseSchemas(filePath, fileContent));
       }
-    }
-
-    return schemas;
-  }
-
-  private findSQLAlchemySchemas(): DatabaseSchemaInfo[] {
-    const schemas: DatabaseSchemaInfo[] = [];
-
-    for (const [filePath, parseResult] of Object.entries(this.parserResults)) {
-      const fileContent = this.getFileContent(filePath);
-      if (!fileContent) continue;
 
       // Check for SQLAlchemy model definitions
       if (fileContent.includes('declarative_base') || fileContent.includes('Column') || 
           fileContent.includes('sqlalchemy')) {
-        schemas.push(...this.parseSQLAlchemyModels(filePath, fileContent));
+        sqlalchemy.push(...this.parseSQLAlchemyModels(filePath, fileContent));
       }
     }
 
-    return schemas;
+    return { typeorm, sequelize, mongoose, sqlalchemy };
   }
 
   private parseTypeORMEntities(filePath: string, content: string): DatabaseSchemaInfo[] {
@@ -1,15 +1,28 @@
 import * as path from 'path';
 import { FileInfo, ParseResult, DependencyAnalysis, DependencyMap, ExternalDependency } from '../types';
+import { findCircularDependencies } from '../utils';
 
 export class DependencyAnalyzer {
   private repoPath: string;
   private fileData: FileInfo[];
   private parserResults: Record<string, ParseResult>;
+  // Scanned paths, built once so internal-file checks are hash lookups instead of scans over fileData
+  private filePaths: Set<string>;
+  // Resolved import paths; relative imports are keyed by importing directory, all others by specifier alone
+  private resolvedImports = new Map<string, string | null>();
+  // Common external package patterns: most npm packages start with lowercase, scoped packages
+  // start with '@', and single word packages
+  private externalPackagePattern = /^(?:[a-z@]|\w+$)/;
+  // Extensions and index files tried when resolving an extensionless or directory import
+  private resolvableExtensions = ['.ts', '.js', '.tsx', '.jsx', '.py'];
+  private indexFileNames = ['index.ts', 'index.js', '__init__.py'];
+  private npmExtensions = new Set(['.js', '.jsx', '.ts', '.tsx']);
 
   constructor(repoPath: string, fileData: FileInfo[], parserResults: Record<string, ParseResult>) {
     this.repoPath = repoPath;
     this.fileData = fileData;
     this.parserResults = parserResults;
+    this.filePaths = new Set(fileData.map(file => file.path));
   }
 
   public analyze(): DependencyAnalysis {
@@ -29,9 +42,10 @@ export class DependencyAnalyzer {
 
     for (const [filePath, parseResult] of Object.entries(this.parserResults)) {
       dependencies[filePath] = [];
+      const currentDir = path.dirname(filePath);
 
       for (const importInfo of parseResult.imports) {
-        const resolvedPath = this.resolveImportPath(filePath, importInfo.module);
+        const resolvedPath = this.resolveImportPath(currentDir, importInfo.module);
         if (resolvedPath && this.isInternalFile(resolvedPath)) {
           dependencies[filePath].push(resolvedPath);
         }
@@ -45,10 +59,11 @@ export class DependencyAnalyzer {
     const externalDeps = new Map<string, ExternalDependency>();
 
     for (const [filePath, parseResult] of Object.entries(this.parserResults)) {
+      const depType = this.getDependencyType(filePath);
+
       for (const importInfo of parseResult.imports) {
         if (this.isExternalDependency(importInfo.module)) {
           const depName = this.extractPackageName(importInfo.module);
-          const depType = this.getDependencyType(filePath);
 
           if (!externalDeps.has(depName)) {
             externalDeps.set(depName, {
@@ -58,8 +73,9 @@ export class DependencyAnalyzer {
             });
           }
 
+          // Files are visited one at a time, so a repeat import from this file can only be the last entry
           const existingDep = externalDeps.get(depName)!;
-          if (!existingDep.files.includes(filePath)) {
+          if (existingDep.files[existingDep.files.length - 1] !== filePath) {
             existingDep.files.push(filePath);
           }
         }
@@ -85,10 +101,24 @@ export class DependencyAnalyzer {
     return graph;
   }
 
-  private resolveImportPath(currentFile: string, importPath: string): string | null {
+  // currentDir is the importing file's directory, computed once per file by the caller
+  private resolveImportPath(currentDir: string, importPath: string): string | null {
+    const isRelative = importPath.startsWith('./') || importPath.startsWith('../');
+    const cacheKey = isRelative ? `${currentDir}\0${importPath}` : importPath;
+
+    const cached = this.resolvedImports.get(cacheKey);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    const resolved = this.resolveUncachedImportPath(currentDir, importPath, isRelative);
+    this.resolvedImports.set(cacheKey, resolved);
+    return resolved;
+  }
+
+  private resolveUncachedImportPath(currentDir: string, importPath: string, isRelative: boolean): string | null {
     // Handle relative imports
-    if (importPath.startsWith('./') || importPath.startsWith('../')) {
-      const currentDir = path.dirname(currentFile);
+    if (isRelative) {
       const resolved = path.join(currentDir, importPath);
       return this.normalizeImportPath(resolved);
     }
@@ -116,8 +146,7 @@ export class DependencyAnalyzer {
     }
 
     // Add common file extensions if missing
-    const extensions = ['.ts', '.js', '.tsx', '.jsx', '.py'];
-    for (const ext of extensions) {
+    for (const ext of this.resolvableExtensions) {
       const withExt = importPath + ext;
       if (this.isInternalFile(withExt)) {
         return withExt;
@@ -125,8 +154,7 @@ export class DependencyAnalyzer {
     }
 
     // Check for index files
-    const indexFiles = ['index.ts', 'index.js', '__init__.py'];
-    for (const indexFile of indexFiles) {
+    for (const indexFile of this.indexFileNames) {
       const indexPath = path.join(importPath, indexFile);
       if (this.isInternalFile(indexPath)) {
         return indexPath;
@@ -143,27 +171,25 @@ export class DependencyAnalyzer {
     paths.push(importPath);
 
     // With common extensions
-    const extensions = ['.ts', '.js', '.tsx', '.jsx', '.py'];
-    for (const ext of extensions) {
+    for (const ext of this.resolvableExtensions) {
       paths.push(importPath + ext);
     }
 
     // As directory with index file
-    const indexFiles = ['index.ts', 'index.js', '__init__.py'];
-    for (const indexFile of indexFiles) {
+    for (const indexFile of this.indexFileNames) {
       paths.push(path.join(importPath, indexFile));
     }
 
-    // In src directory
-    for (const basePath of [importPath, ...paths]) {
-      paths.push(path.join('src', basePath));
+    // In src directory (importPath is already paths[0], so no separate copy is needed)
+    for (let i = 0, count = paths.length; i < count; i++) {
+      paths.push(path.join('src', paths[i]));
     }
 
     return paths;
   }
 
   private isInternalFile(filePath: string): boolean {
-    return this.fileData.some(file => file.path === filePath);
+    return this.filePaths.has(filePath);
   }
 
   private isExternalDependency(importPath: string): boolean {
@@ -172,19 +198,18 @@ export class DependencyAnalyzer {
       return false;
     }
 
-    // Check if it resolves to an internal file
-    if (this.resolveImportPath('', importPath)) {
+    // Cheap name checks first; only plausible package names pay for import resolution
+    if (!this.externalPackagePattern.test(importPath)) {
       return false;
     }
 
-    // Check for common external package patterns
-    const externalPatterns = [
-      /^[a-z]/,  // Most npm packages start with lowercase
-      /^@/,      // Scoped packages
-      /^\w+$/    // Single word packages
-    ];
+    // Only the node: prefix is unambiguous; a bare core-module name like 'events' or 'util' may be a local module
+    if (importPath.startsWith('node:')) {
+      return true;
+    }
 
-    return externalPatterns.some(pattern => pattern.test(importPath));
+    // Check if it resolves to an internal file
+    return !this.resolveImportPath('', importPath);
   }
 
   private extractPackageName(importPath: string): string {
@@ -202,7 +227,7 @@ export class DependencyAnalyzer {
   private getDependencyType(filePath: string): 'npm' | 'pip' | 'other' {
     const ext = path.extname(filePath);
     
-    if (['.js', '.jsx', '.ts', '.tsx'].includes(ext)) {
+    if (this.npmExtensions.has(ext)) {
       return 'npm';
     }
     
@@ -249,41 +274,8 @@ export class DependencyAnalyzer {
     return stats;
   }
 
+  // SCC member lists plus self-imports as [a, a]; see findCircularDependencies
   private detectCircularDependencies(graph: Record<string, string[]>): string[][] {
-    const visited = new Set<string>();
-    const recursionStack = new Set<string>();
-    const cycles: string[][] = [];
-
-    const dfs = (node: string, path: string[]): void => {
-      if (recursionStack.has(node)) {
-        // Found a cycle
-        const cycleStart = path.indexOf(node);
-        if (cycleStart !== -1) {
-          cycles.push([...path.slice(cycleStart), node]);
-        }
-        return;
-      }
-
-      if (visited.has(node)) {
-        return;
-      }
-
-      visited.add(node);
-      recursionStack.add(node);
-
-      for (const neighbor of graph[node] || []) {
-        dfs(neighbor, [...path, node]);
-      }
-
-      recursionStack.delete(node);
-    };
-
-    for (const node of Object.keys(graph)) {
-      if (!visited.has(node)) {
-        dfs(node, []);
-      }
-    }
-
-    return cycles;
+    return findCircularDependencies(Object.keys(graph), node => graph[node]);
   }
-}
\ No newline at end of file
+}
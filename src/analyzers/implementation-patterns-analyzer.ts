@@ -1,4 +1,3 @@
-import * as fs from 'fs';
 import { 
   FileInfo, 
   ParseResult, 
@@ -8,16 +7,21 @@ import {
   BestPracticeInfo, 
   FrameworkPatternInfo 
 } from '../types';
+import { FileContentCache } from '../utils';
 
 export class ImplementationPatternsAnalyzer {
   private repoPath: string;
   private fileData: FileInfo[];
   private parserResults: Record<string, ParseResult>;
+  // File contents by relative path (null when unreadable); every pattern detector rescans the
+  // parsed files, so each one is read from disk once rather than once per detector
+  private fileContents: FileContentCache;
 
   constructor(repoPath: string, fileData: FileInfo[], parserResults: Record<string, ParseResult>) {
     this.repoPath = repoPath;
     this.fileData = fileData;
     this.parserResults = parserResults;
+    this.fileContents = new FileContentCache(repoPath, fileData);
   }
 
   public analyze(): ImplementationPatternsAnalysis {
@@ -929,9 +933,11 @@ export class ImplementationPatternsAnalyzer {
       let currentNesting = 0;
 
       for (const line of lines) {
-        const openBraces = (line.match(/\{/g) || []).length;
-        const closeBraces = (line.match(/\}/g) || []).length;
-        currentNesting += openBraces - closeBraces;
+        // Net brace change for the line in one scan; nesting is still sampled once per line
+        for (const char of line) {
+          if (char === '{') currentNesting++;
+          else if (char === '}') currentNesting--;
+        }
         maxNesting = Math.max(maxNesting, currentNesting);
       }
 
@@ -955,7 +961,8 @@ export class ImplementationPatternsAnalyzer {
     const duplicateThreshold = 10; // Lines of similar code
 
     // Simple duplication detection (would need more sophisticated analysis in practice)
-    const codeBlocks: Record<string, string[]> = {};
+    // Files by code block; a Map keyed by the block text hashes each (long) block once per line
+    const codeBlocks = new Map<string, string[]>();
 
     for (const [filePath, parseResult] of Object.entries(this.parserResults)) {
       const fileContent = this.getFileContent(filePath);
@@ -965,16 +972,18 @@ export class ImplementationPatternsAnalyzer {
       for (let i = 0; i < lines.length - duplicateThreshold; i++) {
         const block = lines.slice(i, i + duplicateThreshold).join('\n').trim();
         if (block.length > 50) { // Minimum block size
-          if (!codeBlocks[block]) {
-            codeBlocks[block] = [];
+          const locations = codeBlocks.get(block);
+          if (locations) {
+            locations.push(filePath);
+          } else {
+            codeBlocks.set(block, [filePath]);
           }
-          codeBlocks[block].push(filePath);
         }
       }
     }
 
     // Find duplicated blocks
-    for (const [block, locations] of Object.entries(codeBlocks)) {
+    for (const locations of codeBlocks.values()) {
       if (locations.length > 1) {
         files.push(...locations);
       }
@@ -1404,11 +1413,6 @@ export class ImplementationPatternsAnalyzer {
   }
 
   private getFileContent(filePath: string): string | null {
-    try {
-      const fullPath = require('path').join(this.repoPath, filePath);
-      return fs.readFileSync(fullPath, 'utf-8');
-    } catch {
-      return null;
-    }
+    return this.fileContents.get(filePath);
   }
 }
\ No newline at end of file
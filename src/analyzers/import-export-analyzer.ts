@@ -149,35 +149,7 @@ export class ImportExportAnalyzer {
     const circularDependencies: string[][] = [];
     const graph = this.buildAdjacencyList(edges);
     const visited = new Set<string>();
-    const recursionStack = new Set<string>();
-
-    const dfs = (node: string, path: string[]): void => {
-      if (recursionStack.has(node)) {
-        // Found a cycle
-        const cycleStart = path.indexOf(node);
-        if (cycleStart !== -1) {
-          const cycle = path.slice(cycleStart);
-          cycle.push(node); // Complete the cycle
-          circularDependencies.push(cycle);
-        }
-        return;
-      }
-
-      if (visited.has(node)) {
-        return;
-      }
-
-      visited.add(node);
-      recursionStack.add(node);
-      path.push(node);
-
-      const neighbors = graph.get(node) || [];
-      for (const neighbor of neighbors) {
-        dfs(neighbor, [...path]);
-      }
-
-      recursionStack.delete(node);
-    };
+    const noNeighbors: string[] = [];
 
     // Only check file-level dependencies for circular detection
     const fileNodes = edges
@@ -187,9 +159,45 @@ export class ImportExportAnalyzer {
 
     const uniqueFiles = [...new Set(fileNodes)];
 
+    // Iterative DFS with an explicit frame stack, so deep import chains can't overflow the call stack.
+    // The current path is shared across frames and each node's position in it is indexed, so a back
+    // edge slices the cycle directly instead of copying the path per neighbor and searching it.
+    const path: string[] = [];
+    const pathIndex = new Map<string, number>();
+    const frames: Array<{ node: string; neighbors: string[]; next: number }> = [];
+
     for (const file of uniqueFiles) {
-      if (!visited.has(file)) {
-        dfs(file, []);
+      if (visited.has(file)) continue;
+
+      visited.add(file);
+      pathIndex.set(file, path.length);
+      path.push(file);
+      frames.push({ node: file, neighbors: graph.get(file) || noNeighbors, next: 0 });
+
+      while (frames.length > 0) {
+        const frame = frames[frames.length - 1];
+
+        if (frame.next < frame.neighbors.length) {
+          const neighbor = frame.neighbors[frame.next++];
+          const cycleStart = pathIndex.get(neighbor);
+
+          if (cycleStart !== undefined) {
+            // Found a cycle
+            const cycle = path.slice(cycleStart);
+            cycle.push(neighbor); // Complete the cycle
+            circularDependencies.push(cycle);
+          } else if (!visited.has(neighbor)) {
+            visited.add(neighbor);
+            pathIndex.set(neighbor, path.length);
+            path.push(neighbor);
+            frames.push({ node: neighbor, neighbors: graph.get(neighbor) || noNeighbors, next: 0 });
+          }
+          continue;
+        }
+
+        frames.pop();
+        path.pop();
+        pathIndex.delete(frame.node);
       }
     }
 
@@ -1,4 +1,3 @@
-import * as fs from 'fs';
 import { 
   FileInfo, 
   ParseResult, 
@@ -9,16 +8,21 @@ import {
   TypeSafetyMetrics, 
   QualityHotspotInfo 
 } from '../types';
+import { FileContentCache } from '../utils';
 
 export class QualityMetricsAnalyzer {
   private repoPath: string;
   private fileData: FileInfo[];
   private parserResults: Record<string, ParseResult>;
+  // File contents by relative path (null when unreadable); type safety, cognitive complexity and
+  // per-function complexity all read the same source files, the last once for every function
+  private fileContents: FileContentCache;
 
   constructor(repoPath: string, fileData: FileInfo[], parserResults: Record<string, ParseResult>) {
     this.repoPath = repoPath;
     this.fileData = fileData;
     this.parserResults = parserResults;
+    this.fileContents = new FileContentCache(repoPath, fileData);
   }
 
   public analyze(): QualityMetricsAnalysis {
@@ -81,7 +85,9 @@ export class QualityMetricsAnalyzer {
 
     const allFunctions = this.getAllFunctions();
     const testedFunctions = this.getTestedFunctions(testFiles);
-    const untestedFunctions = allFunctions.filter(f => !testedFunctions.includes(f));
+    // Set membership keeps the untested scan linear instead of searching the tested list per function
+    const testedFunctionNames = new Set(testedFunctions);
+    const untestedFunctions = allFunctions.filter(f => !testedFunctionNames.has(f));
 
     const coveragePercentage = allFunctions.length > 0 ? 
       (testedFunctions.length / allFunctions.length) * 100 : 0;
@@ -112,11 +118,12 @@ export class QualityMetricsAnalyzer {
       }
     }
 
-    const readmeFiles = this.fileData.filter(f => 
-      f.path.toLowerCase().includes('readme') || 
-      f.path.toLowerCase().includes('documentation') ||
-      f.path.endsWith('.md')
-    ).map(f => f.path);
+    const readmeFiles = this.fileData.filter(f => {
+      const lowerPath = f.path.toLowerCase();
+      return lowerPath.includes('readme') || 
+        lowerPath.includes('documentation') ||
+        f.path.endsWith('.md');
+    }).map(f => f.path);
 
     const jsdocCoverage = totalFunctions > 0 ? (jsdocCount / totalFunctions) * 100 : 0;
     
@@ -422,11 +429,6 @@ export class QualityMetricsAnalyzer {
   }
 
   private getFileContent(filePath: string): string | null {
-    try {
-      const fullPath = require('path').join(this.repoPath, filePath);
-      return fs.readFileSync(fullPath, 'utf-8');
-    } catch {
-      return null;
-    }
+    return this.fileContents.get(filePath);
   }
 }
\ No newline at end of file
@@ -1,4 +1,5 @@
 import * as fs from 'fs';
+import * as path from 'path';
 import { 
   FileInfo, 
   ParseResult, 
@@ -664,7 +665,7 @@ export class SemanticRelationshipsAnalyzer {
   // Helper methods
   private getFileContent(filePath: string): string | null {
     try {
-      const fullPath = require('path').join(this.repoPath, filePath);
+      const fullPath = path.join(this.repoPath, filePath);
       return fs.readFileSync(fullPath, 'utf-8');
     } catch {
       return null;
@@ -730,7 +731,6 @@ export class SemanticRelationshipsAnalyzer {
 
   private resolvePath(basePath: string, relativePath: string): string | null {
     // Simple path resolution for relative imports
-    const path = require('path');
     const resolved = path.resolve(path.dirname(basePath), relativePath);
     
     // Check if the resolved file exists in our parser results
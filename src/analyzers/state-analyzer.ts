@@ -1,4 +1,5 @@
 import * as fs from 'fs';
+import * as path from 'path';
 import { FileInfo, ParseResult, ComponentInfo, StateAnalysisInfo, StateStoreInfo, ComponentRelationship } from '../types';
 
 export class StateAnalyzer {
@@ -488,8 +489,11 @@ export class StateAnalyzer {
       const line = lines[i];
       content += line + '\n';
       
-      braceCount += (line.match(/\{/g) || []).length;
-      braceCount -= (line.match(/\}/g) || []).length;
+      // Count braces in one scan, without allocating match arrays for every line
+      for (const char of line) {
+        if (char === '{') braceCount++;
+        else if (char === '}') braceCount--;
+      }
       
       if (braceCount === 0 && i > startIndex) {
         break;
@@ -674,7 +678,7 @@ export class StateAnalyzer {
 
   private getFileContent(filePath: string): string | null {
     try {
-      const fullPath = require('path').join(this.repoPath, filePath);
+      const fullPath = path.join(this.repoPath, filePath);
       return fs.readFileSync(fullPath, 'utf-8');
     } catch {
       return null;
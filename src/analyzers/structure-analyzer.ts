@@ -11,48 +11,64 @@ export class StructureAnalyzer {
   }
 
   public analyze(): StructureAnalysis {
-    const directoryStructure = this.buildDirectoryTree();
-    const filesByLanguage = this.groupFilesByLanguage();
-    const totalFiles = this.fileData.length;
-    const totalLines = this.calculateTotalLines();
-
-    return {
-      directoryStructure,
-      filesByLanguage,
-      totalFiles,
-      totalLines
-    };
-  }
-
-  private buildDirectoryTree(): DirectoryNode {
     const root: DirectoryNode = {
       name: path.basename(this.repoPath),
       type: 'directory',
       children: []
     };
+    // Subdirectory nodes by name for each directory node, so inserts don't scan sibling lists
+    const subdirectories = new Map<DirectoryNode, Map<string, DirectoryNode>>();
+    const languageCounts = new Map<string, number>();
+    let totalLines = 0;
 
-    // Build tree structure
+    // One pass builds the tree, counts languages and estimates lines
     for (const file of this.fileData) {
-      this.addFileToTree(root, file);
+      this.addFileToTree(root, file, subdirectories);
+
+      const language = file.language || 'unknown';
+      languageCounts.set(language, (languageCounts.get(language) || 0) + 1);
+
+      // This is an estimation since we'd need to read all files.
+      // Rough estimation: average 50 characters per line
+      totalLines += Math.ceil(file.size / 50);
     }
 
     // Sort children recursively
     this.sortTreeChildren(root);
 
-    return root;
+    return {
+      directoryStructure: root,
+      filesByLanguage: this.sortLanguageCounts(languageCounts),
+      totalFiles: this.fileData.length,
+      totalLines
+    };
   }
 
-  private addFileToTree(root: DirectoryNode, file: FileInfo): void {
-    const pathParts = file.path.split(path.sep).filter(part => part.length > 0);
+  private addFileToTree(
+    root: DirectoryNode,
+    file: FileInfo,
+    subdirectories: Map<DirectoryNode, Map<string, DirectoryNode>>
+  ): void {
+    // The scanner joins relative paths with path.sep, so one split yields the components.
+    // Empty components (doubled or trailing separators) are skipped in place rather than filtered
+    // into a second array.
+    const pathParts = file.path.split(path.sep);
+    let last = pathParts.length - 1;
+    while (last >= 0 && pathParts[last].length === 0) last--;
     let currentNode = root;
 
     // Navigate through directories
-    for (let i = 0; i < pathParts.length - 1; i++) {
+    for (let i = 0; i < last; i++) {
       const dirName = pathParts[i];
-      let dirNode = currentNode.children?.find(child => 
-        child.name === dirName && child.type === 'directory'
-      );
+      if (dirName.length === 0) continue;
 
+      let childDirs = subdirectories.get(currentNode);
+      if (!childDirs) {
+        childDirs = new Map();
+        subdirectories.set(currentNode, childDirs);
+      }
+
+      let dirNode = childDirs.get(dirName);
       if (!dirNode) {
         dirNode = {
           name: dirName,
@@ -61,13 +77,14 @@ export class StructureAnalyzer {
         };
         currentNode.children = currentNode.children || [];
         currentNode.children.push(dirNode);
+        childDirs.set(dirName, dirNode);
       }
 
       currentNode = dirNode;
     }
 
     // Add the file
-    const fileName = pathParts[pathParts.length - 1];
+    const fileName = pathParts[last];
     const fileNode: DirectoryNode = {
       name: fileName,
       type: 'file',
@@ -79,33 +96,31 @@ export class StructureAnalyzer {
     currentNode.children.push(fileNode);
   }
 
-  private sortTreeChildren(node: DirectoryNode): void {
-    if (!node.children) return;
-
-    // Sort: directories first, then files, both alphabetically
-    node.children.sort((a, b) => {
-      if (a.type !== b.type) {
-        return a.type === 'directory' ? -1 : 1;
-      }
-      return a.name.localeCompare(b.name);
-    });
+  private sortTreeChildren(root: DirectoryNode): void {
+    // Explicit stack instead of recursion, so deeply nested repositories can't overflow the call stack
+    const pending: DirectoryNode[] = [root];
 
-    // Recursively sort children
-    for (const child of node.children) {
-      this.sortTreeChildren(child);
-    }
-  }
+    while (pending.length > 0) {
+      const node = pending.pop()!;
+      if (!node.children) continue;
 
-  private groupFilesByLanguage(): Record<string, number> {
-    const languageCounts: Record<string, number> = {};
+      // Sort: directories first, then files, both alphabetically
+      node.children.sort((a, b) => {
+        if (a.type !== b.type) {
+          return a.type === 'directory' ? -1 : 1;
+        }
+        return a.name.localeCompare(b.name);
+      });
 
-    for (const file of this.fileData) {
-      const language = file.language || 'unknown';
-      languageCounts[language] = (languageCounts[language] || 0) + 1;
+      for (const child of node.children) {
+        if (child.children) pending.push(child);
+      }
     }
+  }
 
+  private sortLanguageCounts(languageCounts: Map<string, number>): Record<string, number> {
     // Sort by count descending
-    const sortedEntries = Object.entries(languageCounts)
+    const sortedEntries = Array.from(languageCounts)
       .sort((a, b) => b[1] - a[1]);
 
     const sortedLanguageCounts: Record<string, number> = {};
@@ -116,20 +131,6 @@ export class StructureAnalyzer {
     return sortedLanguageCounts;
   }
 
-  private calculateTotalLines(): number {
-    // This is an estimation since we'd need to read all files
-    // For now, we'll estimate based on file sizes
-    let totalLines = 0;
-
-    for (const file of this.fileData) {
-      // Rough estimation: average 50 characters per line
-      const estimatedLines = Math.ceil(file.size / 50);
-      totalLines += estimatedLines;
-    }
-
-    return totalLines;
-  }
-
   public getDirectoryStats(): Record<string, any> {
     const stats = {
       totalDirectories: 0,
@@ -141,7 +142,9 @@ export class StructureAnalyzer {
     };
 
     let totalSize = 0;
+    const directories = new Set<string>();
 
+    // Size, extension and directory aggregates in a single pass over the files
     for (const file of this.fileData) {
       totalSize += file.size;
 
@@ -156,36 +159,22 @@ export class StructureAnalyzer {
       if (file.extension) {
         stats.fileExtensions.add(file.extension);
       }
+
+      // Walk up from the file's directory; once a directory is already known, all of its
+      // ancestors are too, so sibling files stop after a single lookup
+      let dir = path.dirname(file.path);
+      while (dir !== '.' && !directories.has(dir)) {
+        directories.add(dir);
+        dir = path.dirname(dir);
+      }
     }
 
     stats.averageFileSize = Math.round(totalSize / this.fileData.length);
-    stats.totalDirectories = this.countDirectories();
+    stats.totalDirectories = directories.size;
 
     return {
       ...stats,
       fileExtensions: Array.from(stats.fileExtensions).sort()
     };
   }
-
-  private countDirectories(): number {
-    const directories = new Set<string>();
-
-    for (const file of this.fileData) {
-      const dir = path.dirname(file.path);
-      if (dir !== '.') {
-        directories.add(dir);
-        
-        // Add parent directories
-        let parentDir = dir;
-        while (parentDir !== '.' && parentDir !== '/') {
-          parentDir = path.dirname(parentDir);
-          if (parentDir !== '.') {
-            directories.add(parentDir);
-          }
-        }
-      }
-    }
-
-    return directories.size;
-  }
 }
\ No newline at end of file
@@ -1,9 +1,14 @@
+import * as fs from 'fs';
+import * as path from 'path';
 import { FileInfo, ParseResult, VectorEmbeddingInfo } from '../types';
 
 export class VectorAnalyzer {
   private repoPath: string;
   private fileData: FileInfo[];
   private parserResults: Record<string, ParseResult>;
+  // API function indicators as single alternations over the lowercased name and path
+  private apiNamePattern = /get|post|put|delete|patch|handle|process|execute|endpoint|route|api/;
+  private apiPathPattern = /controller|route|api/;
 
   constructor(repoPath: string, fileData: FileInfo[], parserResults: Record<string, ParseResult>) {
     this.repoPath = repoPath;
@@ -44,16 +49,14 @@ export class VectorAnalyzer {
 
   private createDocumentationChunks(): VectorEmbeddingInfo[] {
     const chunks: VectorEmbeddingInfo[] = [];
-    const docFiles = this.fileData.filter(file => 
-      file.extension === '.md' || 
-      file.extension === '.txt' ||
-      file.path.toLowerCase().includes('readme') ||
-      file.path.toLowerCase().includes('doc')
-    );
+    const docFiles = this.fileData.filter(file => {
+      if (file.extension === '.md' || file.extension === '.txt') return true;
+      const lowerPath = file.path.toLowerCase();
+      return lowerPath.includes('readme') || lowerPath.includes('doc');
+    });
 
     for (const file of docFiles) {
       try {
-        const fs = require('fs');
         const content = fs.readFileSync(file.absolutePath, 'utf-8');
         
         // Split large documents into smaller chunks
@@ -127,7 +130,6 @@ export class VectorAnalyzer {
 
     for (const file of configFiles) {
       try {
-        const fs = require('fs');
         const content = fs.readFileSync(file.absolutePath, 'utf-8');
         
         chunks.push({
@@ -241,32 +243,36 @@ export class VectorAnalyzer {
   }
 
   private isAPIFunction(functionName: string, filePath: string): boolean {
-    const apiIndicators = [
-      'get', 'post', 'put', 'delete', 'patch',
-      'handle', 'process', 'execute',
-      'endpoint', 'route', 'api'
-    ];
-
-    const lowerName = functionName.toLowerCase();
-    const lowerPath = filePath.toLowerCase();
-
-    return apiIndicators.some(indicator => 
-      lowerName.includes(indicator) || 
-      lowerPath.includes('controller') ||
-      lowerPath.includes('route') ||
-      lowerPath.includes('api')
-    );
+    // The path checks don't depend on the indicator, so they're tested once rather than per indicator
+    return this.apiPathPattern.test(filePath.toLowerCase()) ||
+      this.apiNamePattern.test(functionName.toLowerCase());
   }
 
   private getFunctionContent(filePath: string, lineStart: number, lineEnd: number): string | null {
     try {
-      const fs = require('fs');
-      const path = require('path');
       const fullPath = path.join(this.repoPath, filePath);
       const content = fs.readFileSync(fullPath, 'utf-8');
-      const lines = content.split('\n');
-      
-      return lines.slice(lineStart - 1, lineEnd).join('\n');
+
+      // Walk newlines up to the function's last line and take one substring, instead of splitting
+      // the whole file into a line array; nothing after the function is scanned
+      let start = 0;
+      for (let line = 1; line < lineStart; line++) {
+        const newline = content.indexOf('\n', start);
+        if (newline === -1) return '';
+        start = newline + 1;
+      }
+
+      if (lineEnd < lineStart) return '';
+
+      let end = start;
+      for (let line = lineStart; line <= lineEnd; line++) {
+        const newline = content.indexOf('\n', end);
+        if (newline === -1) return content.slice(start);
+        if (line === lineEnd) return content.slice(start, newline);
+        end = newline + 1;
+      }
+
+      return '';
     } catch (error) {
       return null;
     }
@@ -1,10 +1,19 @@
 import * as fs from 'fs';
 import * as path from 'path';
 import { AnalysisResults, DirectoryNode } from './types';
+import { topK } from './utils';
 
 export class DocumentGenerator {
   private repoPath: string;
   private analysisResults: AnalysisResults;
+  // Per-file declarations flattened across parser results; the summary and the detailed sections
+  // both read them, so each list is collected once per document
+  private allInterfaces: any[] | null = null;
+  private allTypeAliases: any[] | null = null;
+  private allComponents: any[] | null = null;
+  // formatBytes runs for every file in the tree and the file table, so its unit table and log base are built once
+  private byteUnits = ['B', 'KB', 'MB', 'GB'];
+  private logKilobyte = Math.log(1024);
 
   constructor(repoPath: string, analysisResults: AnalysisResults) {
     this.repoPath = repoPath;
@@ -12,11 +21,21 @@ export class DocumentGenerator {
   }
 
   public generate(outputPath: string): void {
-    const markdown = this.generateMarkdown();
-    fs.writeFileSync(outputPath, markdown, 'utf-8');
+    // Write the sections one after another instead of joining them into a single document-sized
+    // string first; the file contents are the same as sections.join('\n\n')
+    const sections = this.generateSections();
+    const fd = fs.openSync(outputPath, 'w');
+    try {
+      for (let i = 0; i < sections.length; i++) {
+        if (i > 0) fs.writeSync(fd, '\n\n', null, 'utf-8');
+        fs.writeSync(fd, sections[i], null, 'utf-8');
+      }
+    } finally {
+      fs.closeSync(fd);
+    }
   }
 
-  private generateMarkdown(): string {
+  private generateSections(): string[] {
     const repoName = path.basename(this.repoPath);
     const sections: string[] = [];
 
@@ -81,7 +100,7 @@ export class DocumentGenerator {
     // Footer
     sections.push(this.generateFooter());
 
-    return sections.join('\n\n');
+    return sections;
   }
 
   private generateHeader(repoName: string): string {
@@ -279,8 +298,12 @@ export class DocumentGenerator {
     sections.push('### Internal Dependencies');
     sections.push('');
 
-    const totalInternalDeps = Object.values(analysis.internalDependencies)
-      .reduce((sum, deps) => sum + deps.length, 0);
+    let totalInternalDeps = 0;
+    for (const deps of Object.values(analysis.internalDependencies)) {
+      totalInternalDeps += deps.length;
+    }
+
+    const sortedFiles = topK(Object.entries(analysis.internalDependencies), 10, (a, b) => b[1].length - a[1].length);
 
     if (totalInternalDeps === 0) {
       sections.push('No internal dependencies detected.');
@@ -289,10 +312,6 @@ export class DocumentGenerator {
       sections.push('');
 
       // Show files with most dependencies
-      const sortedFiles = Object.entries(analysis.internalDependencies)
-        .sort((a, b) => b[1].length - a[1].length)
-        .slice(0, 10);
-
       if (sortedFiles.length > 0) {
         sections.push('#### Most Dependent Files');
         sections.push('');
@@ -672,37 +691,49 @@ export class DocumentGenerator {
 *Timestamp: ${new Date().toISOString()}*`;
   }
 
-  private renderDirectoryTree(node: DirectoryNode, depth: number): string {
-    const indent = '  '.repeat(depth);
-    const prefix = depth === 0 ? '' : '├── ';
-    let result = `${indent}${prefix}${node.name}`;
+  private renderDirectoryTree(root: DirectoryNode, rootDepth: number): string {
+    // Every node writes its line into one shared buffer that is joined once. An explicit stack
+    // replaces recursion so deeply nested repositories can't overflow the call stack; children
+    // are pushed in reverse so they still come off in order.
+    const lines: string[] = [];
+    const pending: Array<{ node: DirectoryNode; depth: number }> = [{ node: root, depth: rootDepth }];
+    // Indentation plus branch marker, built once per depth rather than once per node
+    const linePrefixes: string[] = [];
+
+    while (pending.length > 0) {
+      const { node, depth } = pending.pop()!;
+      let linePrefix = linePrefixes[depth];
+      if (linePrefix === undefined) {
+        linePrefix = '  '.repeat(depth) + (depth === 0 ? '' : '├── ');
+        linePrefixes[depth] = linePrefix;
+      }
+      let line = linePrefix + node.name;
 
-    if (node.type === 'file') {
-      result += ` (${node.language || 'unknown'})`;
-      if (node.size) {
-        result += ` - ${this.formatBytes(node.size)}`;
+      if (node.type === 'file') {
+        line += ` (${node.language || 'unknown'})`;
+        if (node.size) {
+          line += ` - ${this.formatBytes(node.size)}`;
+        }
       }
-    }
 
-    result += '\n';
+      lines.push(line);
 
-    if (node.children) {
-      for (let i = 0; i < node.children.length; i++) {
-        result += this.renderDirectoryTree(node.children[i], depth + 1);
+      if (node.children) {
+        for (let i = node.children.length - 1; i >= 0; i--) {
+          pending.push({ node: node.children[i], depth: depth + 1 });
+        }
       }
     }
 
-    return result;
+    return lines.join('\n') + '\n';
   }
 
   private formatBytes(bytes: number): string {
     if (bytes === 0) return '0 B';
     
-    const k = 1024;
-    const sizes = ['B', 'KB', 'MB', 'GB'];
-    const i = Math.floor(Math.log(bytes) / Math.log(k));
+    const i = Math.floor(Math.log(bytes) / this.logKilobyte);
     
-    return parseFloat((bytes / Math.pow(k, i)).toFixed(1)) + ' ' + sizes[i];
+    return parseFloat((bytes / Math.pow(1024, i)).toFixed(1)) + ' ' + this.byteUnits[i];
   }
 
   public generateCompactMarkdown(): string {
@@ -839,16 +870,21 @@ export class DocumentGenerator {
     sections.push(`Found **${allComponents.length}** React components:`);
     sections.push('');
 
-    // Component summary
-    const componentsWithProps = allComponents.filter(c => c.props.length > 0);
-    const componentsWithHooks = allComponents.filter(c => c.hooks.length > 0);
-    const jsxComponents = allComponents.filter(c => c.hasJSX);
+    // Component summary: only the counts are shown, so classify every component in one pass
+    let componentsWithProps = 0;
+    let componentsWithHooks = 0;
+    let jsxComponents = 0;
+    for (const component of allComponents) {
+      if (component.props.length > 0) componentsWithProps++;
+      if (component.hooks.length > 0) componentsWithHooks++;
+      if (component.hasJSX) jsxComponents++;
+    }
 
     sections.push('### Component Summary');
     sections.push('');
-    sections.push(`- **${componentsWithProps.length}** components with props`);
-    sections.push(`- **${componentsWithHooks.length}** components using hooks`);
-    sections.push(`- **${jsxComponents.length}** components with JSX`);
+    sections.push(`- **${componentsWithProps}** components with props`);
+    sections.push(`- **${componentsWithHooks}** components using hooks`);
+    sections.push(`- **${jsxComponents}** components with JSX`);
     sections.push('');
 
     // Detailed component analysis
@@ -978,37 +1014,36 @@ export class DocumentGenerator {
   }
 
   private getAllInterfaces(): any[] {
+    return this.allInterfaces || this.collectDeclarations().interfaces;
+  }
+
+  private getAllTypeAliases(): any[] {
+    return this.allTypeAliases || this.collectDeclarations().typeAliases;
+  }
+
+  private getAllComponents(): any[] {
+    return this.allComponents || this.collectDeclarations().components;
+  }
+
+  // One walk over the parser results fills all three declaration lists, instead of a separate walk per kind
+  private collectDeclarations(): { interfaces: any[]; typeAliases: any[]; components: any[] } {
     const interfaces: any[] = [];
-    
+    const typeAliases: any[] = [];
+    const components: any[] = [];
+
     for (const [filePath, parseResult] of Object.entries(this.analysisResults.parserResults)) {
       if (parseResult.interfaces) {
         for (const iface of parseResult.interfaces) {
           interfaces.push({ ...iface, file: filePath });
         }
       }
-    }
 
-    return interfaces;
-  }
-
-  private getAllTypeAliases(): any[] {
-    const typeAliases: any[] = [];
-    
-    for (const [filePath, parseResult] of Object.entries(this.analysisResults.parserResults)) {
       if (parseResult.typeAliases) {
         for (const typeAlias of parseResult.typeAliases) {
           typeAliases.push({ ...typeAlias, file: filePath });
         }
       }
-    }
-
-    return typeAliases;
-  }
 
-  private getAllComponents(): any[] {
-    const components: any[] = [];
-    
-    for (const [filePath, parseResult] of Object.entries(this.analysisResults.parserResults)) {
       if (parseResult.components) {
         for (const component of parseResult.components) {
           components.push({ ...component, file: filePath });
@@ -1016,7 +1051,10 @@ export class DocumentGenerator {
       }
     }
 
-    return components;
+    this.allInterfaces = interfaces;
+    this.allTypeAliases = typeAliases;
+    this.allComponents = components;
+    return { interfaces, typeAliases, components };
   }
 
   private generateSemanticRelationshipsSection(): string {
@@ -6,19 +6,8 @@ import { RepoScanner } from './scanner';
 import { TypeScriptParser } from './parsers/typescript-parser';
 import { JavaScriptParser } from './parsers/javascript-parser';
 import { PythonParser } from './parsers/python-parser';
-import { StructureAnalyzer } from './analyzers/structure-analyzer';
-import { DependencyAnalyzer } from './analyzers/dependency-analyzer';
-import { ApiAnalyzer } from './analyzers/api-analyzer';
-import { StateAnalyzer } from './analyzers/state-analyzer';
-import { DatabaseAnalyzer } from './analyzers/database-analyzer';
-import { CodePatternsAnalyzer } from './analyzers/code-patterns-analyzer';
-import { VectorAnalyzer } from './analyzers/vector-analyzer';
-import { ImportExportAnalyzer } from './analyzers/import-export-analyzer';
-import { SemanticRelationshipsAnalyzer } from './analyzers/semantic-relationships-analyzer';
-import { ImplementationPatternsAnalyzer } from './analyzers/implementation-patterns-analyzer';
-import { BusinessLogicContextAnalyzer } from './analyzers/business-logic-context-analyzer';
-import { QualityMetricsAnalyzer } from './analyzers/quality-metrics-analyzer';
 import { DocumentGenerator } from './document-generator';
+import { ParseCache } from './parse-cache';
 import { AnalysisResults, AnalysisFocus, ParseResult } from './types';
 
 class RepositoryAnalyzer {
@@ -26,12 +15,15 @@ class RepositoryAnalyzer {
   private outputPath: string;
   private focus: AnalysisFocus[];
   private verbose: boolean;
+  private useCache: boolean;
 
-  constructor(repoPath: string, outputPath: string, focus: AnalysisFocus[] = ['all'], verbose: boolean = false) {
+  constructor(repoPath: string, outputPath: string, focus: AnalysisFocus[] = ['all'], verbose: boolean = false, useCache: boolean = true) {
     this.repoPath = path.resolve(repoPath);
     this.outputPath = outputPath;
     this.focus = focus;
     this.verbose = verbose;
+    // REPO_ANALYZER_NO_CACHE turns the parse cache off for every entry point, including the MCP server
+    this.useCache = useCache && !process.env.REPO_ANALYZER_NO_CACHE;
   }
 
   public async analyze(): Promise<boolean> {
@@ -47,9 +39,16 @@ class RepositoryAnalyzer {
       // Parse files
       this.log('📝 Parsing file contents...');
       const parserResults: Record<string, ParseResult> = {};
+      const parseCache = this.useCache ? new ParseCache(this.repoPath) : null;
       
       for (const file of fileData) {
         try {
+          const cached = parseCache?.get(file);
+          if (cached) {
+            parserResults[file.path] = cached;
+            continue;
+          }
+
           let parser;
           
           switch (file.language) {
@@ -67,11 +66,17 @@ class RepositoryAnalyzer {
           }
 
           parserResults[file.path] = parser.parse();
+          parseCache?.set(file, parserResults[file.path]);
         } catch (error) {
-          this.log(`⚠️  Warning: Could not parse ${file.path}: ${error}`);
+          // Parse warnings are only printed in verbose mode; skip formatting them otherwise
+          if (this.verbose) {
+            this.log(`⚠️  Warning: Could not parse ${file.path}: ${error}`);
+          }
         }
       }
 
+      parseCache?.save(fileData);
+
       this.log(`✅ Parsed ${Object.keys(parserResults).length} files`);
 
       // Initialize analysis results
@@ -83,6 +88,7 @@ class RepositoryAnalyzer {
       // Run analyses based on focus
       if (this.shouldRunAnalysis('structure')) {
         this.log('🏗️  Analyzing repository structure...');
+        const { StructureAnalyzer } = await import('./analyzers/structure-analyzer');
         const structureAnalyzer = new StructureAnalyzer(this.repoPath, fileData);
         analysisResults.structureAnalysis = structureAnalyzer.analyze();
         this.log('✅ Structure analysis complete');
@@ -90,6 +96,7 @@ class RepositoryAnalyzer {
 
       if (this.shouldRunAnalysis('dependencies')) {
         this.log('🔗 Analyzing dependencies...');
+        const { DependencyAnalyzer } = await import('./analyzers/dependency-analyzer');
         const dependencyAnalyzer = new DependencyAnalyzer(this.repoPath, fileData, parserResults);
         analysisResults.dependencyAnalysis = dependencyAnalyzer.analyze();
         this.log('✅ Dependency analysis complete');
@@ -97,7 +104,9 @@ class RepositoryAnalyzer {
 
       if (this.shouldRunAnalysis('api')) {
         this.log('🌐 Analyzing APIs...');
+        const { ApiAnalyzer } = await import('./analyzers/api-analyzer');
         const apiAnalyzer = new ApiAnalyzer(this.repoPath, fileData, parserResults);
+        await apiAnalyzer.preloadFileContents();
         analysisResults.apiAnalysis = apiAnalyzer.analyze();
         this.log('✅ API analysis complete');
       }
@@ -109,6 +118,7 @@ class RepositoryAnalyzer {
       
       if (hasReactFiles) {
         this.log('⚛️  Analyzing state management...');
+        const { StateAnalyzer } = await import('./analyzers/state-analyzer');
         const stateAnalyzer = new StateAnalyzer(this.repoPath, fileData, parserResults);
         analysisResults.stateAnalysis = stateAnalyzer.analyze();
         this.log('✅ State analysis complete');
@@ -117,7 +127,9 @@ class RepositoryAnalyzer {
       // Database analysis
       if (this.shouldRunAnalysis('database' as AnalysisFocus) || this.shouldRunAnalysis('all')) {
         this.log('🗄️  Analyzing database schemas...');
+        const { DatabaseAnalyzer } = await import('./analyzers/database-analyzer');
         const databaseAnalyzer = new DatabaseAnalyzer(this.repoPath, fileData, parserResults);
+        await databaseAnalyzer.preloadFileContents();
         analysisResults.databaseAnalysis = databaseAnalyzer.analyze();
         this.log('✅ Database analysis complete');
       }
@@ -125,6 +137,7 @@ class RepositoryAnalyzer {
       // Code patterns analysis
       if (this.shouldRunAnalysis('patterns' as AnalysisFocus) || this.shouldRunAnalysis('all')) {
         this.log('🔍 Analyzing code patterns...');
+        const { CodePatternsAnalyzer } = await import('./analyzers/code-patterns-analyzer');
         const patternsAnalyzer = new CodePatternsAnalyzer(this.repoPath, fileData, parserResults);
         analysisResults.codePatterns = patternsAnalyzer.analyze();
         this.log('✅ Code patterns analysis complete');
@@ -133,6 +146,7 @@ class RepositoryAnalyzer {
       // Import/Export analysis
       if (this.shouldRunAnalysis('dependencies') || this.shouldRunAnalysis('all')) {
         this.log('🔗 Analyzing import/export relationships...');
+        const { ImportExportAnalyzer } = await import('./analyzers/import-export-analyzer');
         const importExportAnalyzer = new ImportExportAnalyzer(this.repoPath, fileData, parserResults);
         analysisResults.importExportGraph = importExportAnalyzer.analyze();
         this.log('✅ Import/export analysis complete');
@@ -141,6 +155,7 @@ class RepositoryAnalyzer {
       // Vector embeddings (optional)
       if (this.shouldRunAnalysis('vector' as AnalysisFocus) || this.shouldRunAnalysis('all')) {
         this.log('🧮 Creating vector embeddings...');
+        const { VectorAnalyzer } = await import('./analyzers/vector-analyzer');
         const vectorAnalyzer = new VectorAnalyzer(this.repoPath, fileData, parserResults);
         analysisResults.vectorEmbeddings = await vectorAnalyzer.analyze();
         this.log('✅ Vector embeddings created');
@@ -150,24 +165,28 @@ class RepositoryAnalyzer {
       if (this.shouldRunAnalysis('all')) {
         // Semantic relationships analysis
         this.log('🔗 Analyzing semantic relationships...');
+        const { SemanticRelationshipsAnalyzer } = await import('./analyzers/semantic-relationships-analyzer');
         const semanticAnalyzer = new SemanticRelationshipsAnalyzer(this.repoPath, fileData, parserResults);
         analysisResults.semanticRelationships = semanticAnalyzer.analyze();
         this.log('✅ Semantic relationships analysis complete');
 
         // Implementation patterns analysis
         this.log('🏗️ Analyzing implementation patterns...');
+        const { ImplementationPatternsAnalyzer } = await import('./analyzers/implementation-patterns-analyzer');
         const implementationPatternsAnalyzer = new ImplementationPatternsAnalyzer(this.repoPath, fileData, parserResults);
         analysisResults.implementationPatterns = implementationPatternsAnalyzer.analyze();
         this.log('✅ Implementation patterns analysis complete');
 
         // Business logic context analysis
         this.log('💼 Analyzing business logic context...');
+        const { BusinessLogicContextAnalyzer } = await import('./analyzers/business-logic-context-analyzer');
         const businessLogicAnalyzer = new BusinessLogicContextAnalyzer(this.repoPath, fileData, parserResults);
         analysisResults.businessLogicContext = businessLogicAnalyzer.analyze();
         this.log('✅ Business logic context analysis complete');
 
         // Quality metrics analysis
         this.log('📊 Analyzing code quality metrics...');
+        const { QualityMetricsAnalyzer } = await import('./analyzers/quality-metrics-analyzer');
         const qualityMetricsAnalyzer = new QualityMetricsAnalyzer(this.repoPath, fileData, parserResults);
         analysisResults.qualityMetrics = qualityMetricsAnalyzer.analyze();
         this.log('✅ Quality metrics analysis complete');
@@ -226,6 +245,8 @@ OPTIONS:
   -o, --output <file>     Output file path (default: analysis.md)
   -f, --focus <type>      Focus analysis (structure|dependencies|api|database|patterns|vector|all)
   -v, --verbose          Enable verbose logging
+  --no-cache             Re-parse every file instead of reusing cached parse results
+                         (or set REPO_ANALYZER_NO_CACHE=1)
   -h, --help             Show this help message
 
 EXAMPLES:
@@ -260,7 +281,8 @@ function parseArgs(): any {
     command,
     output: 'analysis.md',
     focus: ['all'],
-    verbose: false
+    verbose: false,
+    cache: true
   };
 
   // Parse repository path(s)
@@ -294,6 +316,8 @@ function parseArgs(): any {
       config.focus = [focusType];
     } else if (arg === '-v' || arg === '--verbose') {
       config.verbose = true;
+    } else if (arg === '--no-cache') {
+      config.cache = false;
     }
   }
 
@@ -323,7 +347,8 @@ async function main(): Promise<void> {
       config.repoPath,
       config.output,
       config.focus,
-      config.verbose
+      config.verbose,
+      config.cache
     );
 
     const success = await analyzer.analyze();
@@ -340,7 +365,8 @@ async function main(): Promise<void> {
       config.repoPath1,
       config.output,
       config.focus,
-      config.verbose
+      config.verbose,
+      config.cache
     );
 
     const success = await analyzer.analyze();
@@ -0,0 +1,101 @@
+import * as fs from 'fs';
+import * as path from 'path';
+import * as os from 'os';
+import * as crypto from 'crypto';
+import { FileInfo, ParseResult } from './types';
+
+interface CacheEntry {
+  mtimeMs: number;
+  size: number;
+  result: ParseResult;
+}
+
+interface CacheFile {
+  version: string;
+  entries: Record<string, CacheEntry>;
+}
+
+export class ParseCache {
+  private version = ParseCache.parserVersion();
+  private cacheFile: string;
+  private entries: Record<string, CacheEntry> = {};
+  private dirty = false;
+
+  constructor(repoPath: string, cacheDir: string = path.join(os.homedir(), '.cache', 'repo-analyzer')) {
+    const repoKey = crypto.createHash('sha1').update(path.resolve(repoPath)).digest('hex');
+    this.cacheFile = path.join(cacheDir, 'parse', `${repoKey}.json`);
+    this.load();
+  }
+
+  // Cached results are only valid for the parsers that produced them, so the cache version is a hash
+  // of the parser modules: any change to a parser invalidates existing caches without a manual bump
+  private static parserVersion(): string {
+    const hash = crypto.createHash('sha1');
+    const parsersDir = path.join(__dirname, 'parsers');
+
+    try {
+      const files = fs.readdirSync(parsersDir, { withFileTypes: true })
+        .filter(entry => entry.isFile())
+        .map(entry => entry.name)
+        .sort();
+
+      for (const file of files) {
+        hash.update(file);
+        hash.update(fs.readFileSync(path.join(parsersDir, file)));
+      }
+    } catch (error) {
+      // Parsers can't be fingerprinted; use a one-off version so no existing entry is trusted
+      hash.update(crypto.randomBytes(16));
+    }
+
+    return hash.digest('hex');
+  }
+
+  // The scanner has already stat'ed every file, so its mtime and size are compared directly
+  public get(file: FileInfo): ParseResult | undefined {
+    const entry = this.entries[file.path];
+    if (entry && entry.mtimeMs === file.mtimeMs && entry.size === file.size) {
+      return entry.result;
+    }
+
+    return undefined;
+  }
+
+  public set(file: FileInfo, result: ParseResult): void {
+    this.entries[file.path] = { mtimeMs: file.mtimeMs, size: file.size, result };
+    this.dirty = true;
+  }
+
+  // Drop entries for files that are no longer part of the scan and write the cache back to disk
+  public save(fileData: FileInfo[]): void {
+    const livePaths = new Set(fileData.map(f => f.path));
+    for (const filePath of Object.keys(this.entries)) {
+      if (!livePaths.has(filePath)) {
+        delete this.entries[filePath];
+        this.dirty = true;
+      }
+    }
+
+    if (!this.dirty) return;
+
+    try {
+      fs.mkdirSync(path.dirname(this.cacheFile), { recursive: true });
+      const data: CacheFile = { version: this.version, entries: this.entries };
+      fs.writeFileSync(this.cacheFile, JSON.stringify(data));
+      this.dirty = false;
+    } catch (error) {
+      // Caching is best-effort; a read-only home directory shouldn't fail the analysis
+    }
+  }
+
+  private load(): void {
+    try {
+      const data: CacheFile = JSON.parse(fs.readFileSync(this.cacheFile, 'utf-8'));
+      if (data.version === this.version && data.entries) {
+        this.entries = data.entries;
+      }
+    } catch (error) {
+      // No cache yet or unreadable cache; start fresh
+    }
+  }
+}
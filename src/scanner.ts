@@ -65,30 +65,34 @@ export class RepoScanner {
     '.txt': 'text'
   };
 
+  // Compiled glob patterns, built lazily so add/removeIgnorePattern stay cheap
+  private globRegexCache: Map<string, RegExp> = new Map();
+
   constructor(repoPath: string) {
     this.repoPath = path.resolve(repoPath);
   }
 
   public scan(): FileInfo[] {
     const files: FileInfo[] = [];
-    this.scanDirectory(this.repoPath, files);
+    this.scanDirectory(this.repoPath, '', files);
     return files.sort((a, b) => a.path.localeCompare(b.path));
   }
 
-  private scanDirectory(dirPath: string, files: FileInfo[]): void {
+  private scanDirectory(dirPath: string, relativeDir: string, files: FileInfo[]): void {
     try {
       const entries = fs.readdirSync(dirPath, { withFileTypes: true });
 
       for (const entry of entries) {
         const fullPath = path.join(dirPath, entry.name);
-        const relativePath = path.relative(this.repoPath, fullPath);
+        // Extend the parent's relative path instead of recomputing it from the repo root
+        const relativePath = relativeDir ? relativeDir + path.sep + entry.name : entry.name;
 
         if (this.shouldIgnore(entry.name, relativePath)) {
           continue;
         }
 
         if (entry.isDirectory()) {
-          this.scanDirectory(fullPath, files);
+          this.scanDirectory(fullPath, relativePath, files);
         } else if (entry.isFile()) {
           const fileInfo = this.createFileInfo(fullPath, relativePath);
           if (fileInfo) {
@@ -112,6 +116,7 @@ export class RepoScanner {
         absolutePath,
         language,
         size: stats.size,
+        mtimeMs: stats.mtimeMs,
         extension
       };
     } catch (error) {
@@ -124,7 +129,7 @@ export class RepoScanner {
     for (const pattern of this.ignorePatterns) {
       if (pattern.includes('*')) {
         // Simple glob pattern matching
-        const regex = new RegExp('^' + pattern.replace(/\*/g, '.*') + '$');
+        const regex = this.getGlobRegex(pattern);
         if (regex.test(fileName) || regex.test(relativePath)) {
           return true;
         }
@@ -144,6 +149,15 @@ export class RepoScanner {
     return false;
   }
 
+  private getGlobRegex(pattern: string): RegExp {
+    let regex = this.globRegexCache.get(pattern);
+    if (!regex) {
+      regex = new RegExp('^' + pattern.replace(/\*/g, '.*') + '$');
+      this.globRegexCache.set(pattern, regex);
+    }
+    return regex;
+  }
+
   public addIgnorePattern(pattern: string): void {
     this.ignorePatterns.push(pattern);
   }
@@ -3,6 +3,7 @@ export interface FileInfo {
   absolutePath: string;
   language?: string;
   size: number;
+  mtimeMs: number;
   extension: string;
 }
 
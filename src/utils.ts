@@ -0,0 +1,147 @@
+import * as fs from 'fs';
+import * as path from 'path';
+import { FileInfo } from './types';
+
+// Circular dependencies via an iterative Tarjan SCC pass. Every strongly connected cluster of two or
+// more files is reported as its full member list, in discovery order, and every file that imports
+// itself is reported as [a, a], whether or not it also belongs to a larger cluster. An explicit frame
+// stack replaces recursion so deep import chains can't overflow the call stack.
+export function findCircularDependencies(
+  nodes: Iterable<string>,
+  getNeighbors: (node: string) => string[] | undefined
+): string[][] {
+  const index = new Map<string, number>();
+  const lowlink = new Map<string, number>();
+  const onStack = new Set<string>();
+  const sccStack: string[] = [];
+  const cycles: string[][] = [];
+  let nextIndex = 0;
+
+  for (const root of nodes) {
+    if (index.has(root)) continue;
+
+    index.set(root, nextIndex);
+    lowlink.set(root, nextIndex);
+    nextIndex++;
+    sccStack.push(root);
+    onStack.add(root);
+    const frames: Array<{ node: string; next: number }> = [{ node: root, next: 0 }];
+
+    while (frames.length > 0) {
+      const frame = frames[frames.length - 1];
+      const neighbors = getNeighbors(frame.node) || [];
+
+      if (frame.next < neighbors.length) {
+        const neighbor = neighbors[frame.next++];
+        if (neighbor === frame.node) {
+          cycles.push([neighbor, neighbor]);
+        } else if (!index.has(neighbor)) {
+          index.set(neighbor, nextIndex);
+          lowlink.set(neighbor, nextIndex);
+          nextIndex++;
+          sccStack.push(neighbor);
+          onStack.add(neighbor);
+          frames.push({ node: neighbor, next: 0 });
+        } else if (onStack.has(neighbor)) {
+          lowlink.set(frame.node, Math.min(lowlink.get(frame.node)!, index.get(neighbor)!));
+        }
+        continue;
+      }
+
+      frames.pop();
+      if (frames.length > 0) {
+        const parent = frames[frames.length - 1].node;
+        lowlink.set(parent, Math.min(lowlink.get(parent)!, lowlink.get(frame.node)!));
+      }
+
+      if (lowlink.get(frame.node) === index.get(frame.node)) {
+        const component: string[] = [];
+        let member: string;
+        do {
+          member = sccStack.pop()!;
+          onStack.delete(member);
+          component.push(member);
+        } while (member !== frame.node);
+
+        if (component.length > 1) {
+          cycles.push(component.reverse());
+        }
+      }
+    }
+  }
+
+  return cycles;
+}
+
+// The k smallest entries under `compare`, kept with a bounded insertion instead of sorting everything.
+// Ties keep input order, so the result equals a stable sort followed by slice(0, k).
+export function topK<T>(entries: Iterable<T>, k: number, compare: (a: T, b: T) => number): T[] {
+  const top: T[] = [];
+  if (k <= 0) return top;
+
+  for (const entry of entries) {
+    if (top.length === k && compare(entry, top[k - 1]) >= 0) continue;
+
+    let insertAt = top.length;
+    while (insertAt > 0 && compare(top[insertAt - 1], entry) > 0) {
+      insertAt--;
+    }
+    top.splice(insertAt, 0, entry);
+    if (top.length > k) top.pop();
+  }
+
+  return top;
+}
+
+// File contents keyed by relative path and read from disk at most once (null when unreadable).
+// Analyzers that scan the same files in several passes share one instance instead of re-reading.
+export class FileContentCache {
+  private repoPath: string;
+  private contents = new Map<string, string | null>();
+  // Absolute paths resolved by the scanner, so reads don't re-join against repoPath
+  private absolutePaths: Map<string, string>;
+  // Concurrent reads per batch in preload(); bounded to stay clear of EMFILE
+  private preloadBatchSize = 64;
+
+  constructor(repoPath: string, fileData: FileInfo[]) {
+    this.repoPath = repoPath;
+    this.absolutePaths = new Map(fileData.map(f => [f.path, f.absolutePath]));
+  }
+
+  public get(filePath: string): string | null {
+    const cached = this.contents.get(filePath);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    let content: string | null;
+    try {
+      content = fs.readFileSync(this.resolve(filePath), 'utf-8');
+    } catch {
+      content = null;
+    }
+
+    this.contents.set(filePath, content);
+    return content;
+  }
+
+  // Read the given files concurrently, in bounded batches, so later get() calls are cache hits
+  public async preload(filePaths: string[]): Promise<void> {
+    const pending = filePaths.filter(filePath => !this.contents.has(filePath));
+
+    for (let i = 0; i < pending.length; i += this.preloadBatchSize) {
+      const batch = pending.slice(i, i + this.preloadBatchSize);
+      await Promise.all(batch.map(async filePath => {
+        try {
+          this.contents.set(filePath, await fs.promises.readFile(this.resolve(filePath), 'utf-8'));
+        } catch {
+          this.contents.set(filePath, null);
+        }
+      }));
+    }
+  }
+
+  private resolve(filePath: string): string {
+    return this.absolutePaths.get(filePath) || path.join(this.repoPath, filePath);
+  }
+}